@@ -0,0 +1,277 @@
+"""
+Runtime Calibration - DAA Prelim Exam
+Times each algorithm on a few small samples, fits a complexity model
+(n², n log n or n) to the timings and predicts how long any n would take.
+The fits are saved per machine, so each machine only calibrates once
+
+    predictor = RuntimePredictor()
+    seconds = predictor.predict(dataset, "Bubble Sort", "ID", 100000)
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import time
+
+import dataset_store
+import native_backend
+import sorting_algorithms
+
+# Saved fits, next to the dataset (one section per machine)
+CALIBRATION_PATH = os.path.join(os.path.dirname(dataset_store.DEFAULT_DATA_PATH), "calibration.json")
+
+# Complexity models the timings are fitted against: t(n) = intercept + slope * f(n)
+MODELS = {
+    "n²": lambda n: n * n,
+    "n log n": lambda n: n * math.log2(max(n, 2)),
+    "n": lambda n: n,
+}
+
+# Sample sizes start here and double until the time budget runs out
+CALIBRATION_START_SIZE = 256
+CALIBRATION_MAX_SIZE = 32768
+CALIBRATION_BUDGET = 1.0  # Seconds of sorting per algorithm/column (at least 4 sizes either way)
+CALIBRATION_MIN_POINTS = 4
+
+# Only the largest sizes are fitted: below a few thousand rows the timings are
+# mostly fixed overhead and cache effects, which say little about big n
+FIT_POINTS = 4
+
+# GUI choice that runs whichever algorithm is predicted to be fastest
+AUTO_ALGORITHM = "Auto (fastest predicted)"
+
+# Section of the calibration file holding Hybrid Merge Sort's tuned cutoffs:
+# {machine_id: {key type name: cutoff}}
+HYBRID_CUTOFFS_SECTION = "hybrid_cutoffs"
+
+def machine_id():
+    """
+    What a fit is only valid for: this computer and this Python
+    """
+    return (f"{platform.node()}|{platform.machine()}|{platform.python_implementation()} "
+            f"{platform.python_version()}|{os.cpu_count()}")
+
+def _read_calibration(path):
+    """
+    The whole calibration file (every machine), or {} if there isn't one yet
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def _write_calibration(path, everything):
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(everything, file, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError:
+        # Read-only folder etc. - the values still work for this session
+        pass
+
+def load_hybrid_cutoffs(path=CALIBRATION_PATH):
+    """
+    {key type name: cutoff} saved by tune_hybrid_cutoff on this machine ({} if never tuned)
+    """
+    return _read_calibration(path).get(HYBRID_CUTOFFS_SECTION, {}).get(machine_id(), {})
+
+def save_hybrid_cutoffs(cutoffs, path=CALIBRATION_PATH):
+    """
+    Saves {key type name: cutoff} for this machine, keeping the other key types and machines
+    """
+    everything = _read_calibration(path)
+    saved = everything.setdefault(HYBRID_CUTOFFS_SECTION, {}).setdefault(machine_id(), {})
+    saved.update(cutoffs)
+    _write_calibration(path, everything)
+
+def _growth(sizes, values):
+    """
+    How fast values grow from the first size to the last, as a power of n
+    (the slope on a log-log plot: 1 for n, about 1.1 for n log n, 2 for n²)
+    """
+    return math.log(values[-1] / values[0]) / math.log(sizes[-1] / sizes[0])
+
+def _least_squares(xs, times):
+    """
+    Fits t = intercept + slope * x, weighted so each point counts by its
+    relative error; returns (intercept, slope, relative RMS error)
+    """
+    weights = [1 / (t * t) for t in times]
+    sw = sum(weights)
+    sx = sum(w * x for w, x in zip(weights, xs))
+    sy = sum(w * t for w, t in zip(weights, times))
+    sxx = sum(w * x * x for w, x in zip(weights, xs))
+    sxy = sum(w * x * t for w, x, t in zip(weights, xs, times))
+    det = sw * sxx - sx * sx
+    slope = (sw * sxy - sx * sy) / det if det else 0.0
+    intercept = (sy - slope * sx) / sw
+
+    # A negative intercept or slope is noise, not overhead: refit through the origin
+    if intercept < 0 or slope <= 0:
+        intercept = 0.0
+        slope = sxy / sxx
+
+    error = math.sqrt(sum(((intercept + slope * x) - t) ** 2 / (t * t)
+                          for x, t in zip(xs, times)) / len(times))
+    return intercept, slope, error
+
+def fit_model(sizes, times):
+    """
+    Fits t = intercept + slope * f(n) over the FIT_POINTS largest sizes, with
+    f the model whose growth over those sizes is closest to the measured growth
+    (comparing fit errors instead lets the intercept make n² fit nearly anything)
+    Returns the fit as a dict
+    """
+    fit_sizes, fit_times = sizes[-FIT_POINTS:], times[-FIT_POINTS:]
+
+    if len(fit_sizes) < 2:
+        model = "n log n"
+    else:
+        measured = _growth(fit_sizes, fit_times)
+        model = min(MODELS, key=lambda m: abs(_growth(fit_sizes, [MODELS[m](n) for n in fit_sizes]) - measured))
+
+    intercept, slope, error = _least_squares([MODELS[model](n) for n in fit_sizes], fit_times)
+    return {"model": model, "intercept": intercept, "slope": slope, "error": error,
+            "sizes": list(sizes), "times": list(times)}
+
+def predict_time(fit, n):
+    """
+    Seconds the fitted model expects a sort of n records to take
+    """
+    return fit["intercept"] + fit["slope"] * MODELS[fit["model"]](n)
+
+def time_algorithm(dataset, algorithm, column, n, repeat=3, cancel_event=None):
+    """
+    Best of repeat runs of sort_records on the first n rows (same call as the CLI)
+    Returns None if cancel_event was set partway
+    """
+    subset = dataset[:n]
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        if sorting_algorithms.sort_records(algorithm, subset, column, cancel_event=cancel_event) is None:
+            return None
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+def measure(dataset, algorithm, column, budget=CALIBRATION_BUDGET, max_size=CALIBRATION_MAX_SIZE, cancel_event=None):
+    """
+    Times the algorithm on 256, 512, 1024, ... rows until the budget is spent
+    Returns (sizes, times), or None if cancel_event was set partway;
+    raises ValueError if the algorithm can't sort the column
+    """
+    max_size = min(max_size, len(dataset))
+    sizes, times = [], []
+    spent = 0.0
+    n = min(CALIBRATION_START_SIZE, max_size)
+    while n <= max_size:
+        duration = time_algorithm(dataset, algorithm, column, n, cancel_event=cancel_event)
+        if duration is None:
+            return None
+        sizes.append(n)
+        times.append(max(duration, 1e-7))
+        spent += duration * 3
+        if len(sizes) >= CALIBRATION_MIN_POINTS and spent >= budget:
+            break
+        if n == max_size:
+            break
+        n = min(n * 2, max_size)
+    return sizes, times
+
+class RuntimePredictor:
+    """
+    Fitted models for this machine, keyed by (algorithm, column)
+    Anything not calibrated yet is calibrated the first time it's asked for
+    """
+
+    def __init__(self, path=CALIBRATION_PATH):
+        self.path = path
+        self.machine = machine_id()
+        self.fits = _read_calibration(path).get(self.machine, {})
+
+    @staticmethod
+    def _key(algorithm, column):
+        return f"{algorithm}|{column}"
+
+    def fit(self, algorithm, column):
+        """
+        The saved fit, or None if this algorithm/column isn't calibrated yet
+        """
+        return self.fits.get(self._key(algorithm, column))
+
+    def calibrate(self, dataset, algorithm, column, save=True, cancel_event=None):
+        """
+        Measures and fits the algorithm on this column (replacing any old fit)
+        Returns the fit, or None if the algorithm can't sort the column
+        or cancel_event was set (nothing is saved then)
+        """
+        try:
+            measured = measure(dataset, algorithm, column, cancel_event=cancel_event)
+        except ValueError:
+            # e.g. Radix Sort on a name column
+            return None
+        if measured is None or not measured[0]:
+            return None
+        sizes, times = measured
+        fit = fit_model(sizes, times)
+        fit["calibrated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.fits[self._key(algorithm, column)] = fit
+        if save:
+            self.save()
+        return fit
+
+    def predict(self, dataset, algorithm, column, n, calibrate=True, cancel_event=None):
+        """
+        Predicted seconds to sort n records, or None if there's no fit
+        (and calibrate is False, the algorithm can't sort the column or calibrating was cancelled)
+        Calibrating takes a second or two, so keep calibrate=True off the GUI thread
+        """
+        fit = self.fit(algorithm, column)
+        if fit is None and calibrate:
+            fit = self.calibrate(dataset, algorithm, column, cancel_event=cancel_event)
+        if fit is None:
+            return None
+        return predict_time(fit, n)
+
+    def fastest(self, dataset, column, n, algorithms=None, cancel_event=None):
+        """
+        (algorithm, predicted seconds) of the fastest from-scratch algorithm for this column,
+        or None if none of them has a fit or cancel_event was set
+        """
+        if algorithms is None:
+            algorithms = [name for name in sorting_algorithms.ALGORITHMS if name != native_backend.NATIVE_BASELINE]
+        best = None
+        for algorithm in algorithms:
+            seconds = self.predict(dataset, algorithm, column, n, cancel_event=cancel_event)
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if seconds is not None and (best is None or seconds < best[1]):
+                best = (algorithm, seconds)
+        return best
+
+    def save(self):
+        """
+        Writes this machine's fits back, keeping the other machines' sections (and the hybrid cutoffs)
+        """
+        everything = _read_calibration(self.path)
+        everything[self.machine] = self.fits
+        _write_calibration(self.path, everything)
+
+def format_duration(seconds):
+    """
+    0.042 seconds / 1.5 seconds / 2.3 minutes / 4.1 hours
+    """
+    if seconds < 1:
+        return f"{seconds:.3f} seconds"
+    if seconds < 60:
+        return f"{seconds:.1f} seconds"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f} minutes"
+    return f"{seconds / 3600:.1f} hours"
@@ -0,0 +1,406 @@
+"""
+Command Line Tools - DAA Prelim Exam
+Runs the sorting benchmarks without the Tkinter GUI (for headless/CI machines)
+
+    python cli.py bench --algorithms "Merge Sort" "Radix Sort" --columns ID --sizes 1000 10000
+    python cli.py index
+    python cli.py lookup --column LastName --prefix Sm
+    python cli.py calibrate --predict 100000 1000000
+"""
+
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import sorting_algorithms
+import dataset_store
+import native_backend
+import sorted_index
+import calibration
+from dataset_store import ColumnarDataset
+
+RESULT_FIELDS = [
+    "algorithm", "column", "n", "descending", "repeat",
+    "median_s", "min_s", "max_s", "mean_s", "stddev_s", "records_per_sec", "speedup_vs_merge", "slowdown_vs_native",
+    "comparisons", "moves", "key_lookups", "peak_bytes", "predicted_s", "model", "extrapolated", "error",
+]
+
+def supports(algorithm, column):
+    """
+    Whether the algorithm can sort this column (Radix/Counting need ints, String Radix needs text)
+    """
+    if column in ColumnarDataset.INTEGER_COLUMNS:
+        return algorithm not in sorting_algorithms.STRING_KEY_ALGORITHMS
+    return algorithm not in sorting_algorithms.INTEGER_KEY_ALGORITHMS
+
+def time_sort(dataset, algorithm, column, n, descending=False, repeat=5, warmup=1, timeout=None):
+    """
+    Times sort_records on the first n rows, the same call the GUI makes
+    Each run gets at most timeout seconds; returns one result row (see RESULT_FIELDS)
+    """
+    subset = dataset[:n]
+    result = {"algorithm": algorithm, "column": column, "n": n, "descending": descending,
+              "repeat": repeat, "error": ""}
+
+    timings = []
+    try:
+        for run in range(warmup + repeat):
+            gc.collect()
+            start = time.perf_counter()
+            sorted_rows = sorting_algorithms.sort_records(algorithm, subset, column, descending, deadline=timeout)
+            duration = time.perf_counter() - start
+            if sorted_rows is None:
+                result["error"] = f"timed out after {timeout:g}s"
+                return result
+            if run >= warmup:
+                timings.append(duration)
+    except ValueError as e:
+        # e.g. Counting Sort on a value range that is too wide
+        result["error"] = str(e)
+        return result
+
+    median = statistics.median(timings)
+    result.update({
+        "median_s": median,
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "mean_s": statistics.mean(timings),
+        "stddev_s": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "records_per_sec": n / median if median > 0 else float("inf"),
+    })
+    return result
+
+def count_sort(dataset, algorithm, column, n, descending=False, timeout=None):
+    """
+    One extra, untimed run over instrumented keys (see instrumentation.py)
+    Returns the operation counts as result fields, or None if it timed out
+    """
+    counter = sorting_algorithms.count_operations(algorithm, dataset[:n], [(column, descending)], deadline=timeout)
+    if counter is None:
+        return None
+    return counter.as_dict()
+
+def run_benchmark(dataset, algorithms, columns, sizes, descending=False, repeat=5, warmup=1, log=None, timeout=None,
+                  count_ops=False, predictor=None, extrapolate_above=None):
+    """
+    Runs every algorithm x column x size combination and returns the result rows
+    count_ops adds comparisons / moves / key lookups / peak memory from one instrumented run
+    With a predictor every row gets its predicted time, and combinations predicted
+    to take longer than extrapolate_above seconds are extrapolated instead of run
+    """
+    results = []
+    for algorithm in algorithms:
+        for column in columns:
+            if not supports(algorithm, column):
+                continue
+            for n in sizes:
+                n = min(n, len(dataset))
+                predicted = predictor.predict(dataset, algorithm, column, n) if predictor else None
+                if predicted is not None and extrapolate_above is not None and predicted > extrapolate_above:
+                    result = {"algorithm": algorithm, "column": column, "n": n, "descending": descending,
+                              "repeat": 0, "predicted_s": predicted, "extrapolated": True,
+                              "model": predictor.fit(algorithm, column)["model"], "error": ""}
+                    results.append(result)
+                    if log:
+                        log(f"{algorithm:<26} {column:<10} {n:>9,}  predicted {predicted:.4f}s "
+                            f"({result['model']} fit), not run")
+                    continue
+
+                result = time_sort(dataset, algorithm, column, n, descending, repeat, warmup, timeout)
+                if predicted is not None:
+                    result["predicted_s"] = predicted
+                    result["model"] = predictor.fit(algorithm, column)["model"]
+                results.append(result)
+                if log:
+                    if result["error"]:
+                        log(f"{algorithm:<26} {column:<10} {n:>9,}  error: {result['error']}")
+                    else:
+                        log(f"{algorithm:<26} {column:<10} {n:>9,}  median {result['median_s']:.4f}s  "
+                            f"min {result['min_s']:.4f}s  {result['records_per_sec']:>12,.0f} rec/s")
+
+                # The NumPy sort runs in C, there is nothing to count
+                if count_ops and not result["error"] and algorithm != native_backend.NATIVE_BASELINE:
+                    counts = count_sort(dataset, algorithm, column, n, descending, timeout)
+                    if counts is not None:
+                        result.update(counts)
+                    if log:
+                        if counts is None:
+                            log(f"{algorithm:<26} {column:<10} {n:>9,}  operation count timed out after {timeout:g}s")
+                        else:
+                            log(f"{algorithm:<26} {column:<10} {n:>9,}  {counts['comparisons']:,} comparisons  "
+                                f"{counts['moves']:,} moves  {counts['key_lookups']:,} key lookups  "
+                                f"{counts['peak_bytes'] / 1024:,.0f} KiB peak")
+
+    add_hybrid_speedup(results, log)
+    add_native_comparison(results, log)
+    return results
+
+def add_hybrid_speedup(results, log=None):
+    """
+    Fills in speedup_vs_merge (plain Merge Sort median / Hybrid Merge Sort median)
+    for every Hybrid Merge Sort row that has a matching Merge Sort row
+    """
+    merge_medians = {
+        (r["column"], r["n"], r["descending"]): r["median_s"]
+        for r in results if r["algorithm"] == "Merge Sort" and "median_s" in r
+    }
+    for result in results:
+        if result["algorithm"] != "Hybrid Merge Sort" or "median_s" not in result:
+            continue
+        merge_median = merge_medians.get((result["column"], result["n"], result["descending"]))
+        if merge_median and result["median_s"] > 0:
+            result["speedup_vs_merge"] = merge_median / result["median_s"]
+            if log:
+                log(f"Hybrid Merge Sort vs Merge Sort  {result['column']:<10} {result['n']:>9,}  "
+                    f"{result['speedup_vs_merge']:.2f}x faster")
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def write_results(results, fmt, output):
+    if fmt == "json":
+        json.dump({"machine": machine_info(), "results": results}, output, indent=2)
+        output.write("\n")
+    else:
+        writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+def _resolve_algorithms(names):
+    """
+    Matches algorithm names case-insensitively ("merge sort" -> "Merge Sort")
+    """
+    by_lower = {name.lower(): name for name in sorting_algorithms.ALGORITHMS}
+    resolved = []
+    for name in names:
+        if name.lower() not in by_lower:
+            raise SystemExit(f"Unknown algorithm '{name}'. Choose from: {', '.join(sorting_algorithms.ALGORITHMS)}")
+        resolved.append(by_lower[name.lower()])
+    return resolved
+
+def cmd_bench(args):
+    algorithms = _resolve_algorithms(args.algorithms) if args.algorithms else list(sorting_algorithms.ALGORITHMS)
+    if args.baseline:
+        if not native_backend.available():
+            raise SystemExit("--baseline needs NumPy (pip install numpy)")
+        if native_backend.NATIVE_BASELINE not in algorithms:
+            algorithms.append(native_backend.NATIVE_BASELINE)
+    log = (lambda line: print(line, file=sys.stderr)) if not args.quiet else None
+
+    start = time.perf_counter()
+    dataset, from_cache = dataset_store.load_dataset(args.data)
+    if log:
+        source = "cache" if from_cache else "CSV"
+        log(f"Loaded {len(dataset):,} records from {source} in {time.perf_counter() - start:.2f}s")
+
+    if args.tune_hybrid:
+        tune_hybrid(dataset, args.columns, log)
+
+    predictor = None
+    if args.extrapolate_above is not None:
+        predictor = calibration.RuntimePredictor()
+
+    results = run_benchmark(dataset, algorithms, args.columns, args.sizes,
+                            args.descending, args.repeat, args.warmup, log, args.timeout, args.count_ops,
+                            predictor, args.extrapolate_above)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as output:
+            write_results(results, args.format, output)
+    else:
+        write_results(results, args.format, sys.stdout)
+
+def add_native_comparison(results, log=None):
+    """
+    Fills in slowdown_vs_native (algorithm median / native baseline median) for
+    every row that has a matching native baseline row, so each pure-Python
+    algorithm is reported against a production-speed reference
+    """
+    native_medians = {
+        (r["column"], r["n"], r["descending"]): r["median_s"]
+        for r in results if r["algorithm"] == native_backend.NATIVE_BASELINE and "median_s" in r
+    }
+    for result in results:
+        if result["algorithm"] == native_backend.NATIVE_BASELINE or "median_s" not in result:
+            continue
+        native_median = native_medians.get((result["column"], result["n"], result["descending"]))
+        if native_median:
+            result["slowdown_vs_native"] = result["median_s"] / native_median
+            if log:
+                log(f"{result['algorithm']:<26} {result['column']:<10} {result['n']:>9,}  "
+                    f"{result['slowdown_vs_native']:,.1f}x the native baseline time")
+
+def tune_hybrid(dataset, columns, log=None):
+    """
+    Picks Hybrid Merge Sort's insertion sort cutoff for each column's key type
+    Returns {column: (cutoff, {cutoff: seconds})}
+    """
+    tuned = {}
+    for column in columns:
+        cutoff, timings = sorting_algorithms.tune_hybrid_cutoff(dataset.column(column))
+        tuned[column] = (cutoff, timings)
+        if log:
+            speedup = timings[1] / timings[cutoff] if timings.get(cutoff) else 1.0
+            log(f"Hybrid cutoff for {column:<10} {cutoff:>3}  ({speedup:.2f}x vs plain merge sort on the sample)")
+    return tuned
+
+def cmd_tune(args):
+    dataset, _ = dataset_store.load_dataset(args.data)
+    tuned = tune_hybrid(dataset, args.columns)
+    for column, (cutoff, timings) in tuned.items():
+        print(f"{column}: best cutoff {cutoff}")
+        for candidate, seconds in timings.items():
+            marker = "  <-- best" if candidate == cutoff else ""
+            label = "plain merge sort" if candidate == 1 else f"cutoff {candidate}"
+            print(f"    {label:<18} {seconds:.4f}s  {timings[1] / seconds:.2f}x{marker}")
+    print(f"Saved for this machine in {calibration.CALIBRATION_PATH} (Hybrid Merge Sort uses it from now on)")
+
+def cmd_calibrate(args):
+    algorithms = _resolve_algorithms(args.algorithms) if args.algorithms else list(sorting_algorithms.ALGORITHMS)
+    dataset, _ = dataset_store.load_dataset(args.data)
+    predictor = calibration.RuntimePredictor(args.calibration_file)
+    print(f"Machine: {predictor.machine}")
+
+    for column in args.columns:
+        print(f"\n{column}")
+        for algorithm in algorithms:
+            if not supports(algorithm, column):
+                continue
+            fit = None if args.recalibrate else predictor.fit(algorithm, column)
+            if fit is None:
+                fit = predictor.calibrate(dataset, algorithm, column)
+            if fit is None:
+                print(f"    {algorithm:<26} can't sort this column")
+                continue
+            predictions = "  ".join(
+                f"n={n:,}: {calibration.format_duration(calibration.predict_time(fit, n))}" for n in args.predict
+            )
+            print(f"    {algorithm:<26} {fit['model']:<8} ±{fit['error'] * 100:4.1f}%  {predictions}")
+
+        for n in args.predict:
+            fastest = predictor.fastest(dataset, column, n, [algo for algo in algorithms if supports(algo, column)
+                                                              and algo != native_backend.NATIVE_BASELINE])
+            if fastest:
+                print(f"    Fastest predicted for n={n:,}: {fastest[0]} ({calibration.format_duration(fastest[1])})")
+    print(f"\nFits saved to {predictor.path}")
+
+def cmd_index(args):
+    dataset, _ = dataset_store.load_dataset(args.data)
+    start = time.perf_counter()
+    indexes = sorted_index.load_or_build_indexes(dataset, args.data, args.columns, rebuild=args.rebuild)
+    duration = time.perf_counter() - start
+    for column in indexes:
+        print(f"{column:<10} {len(indexes[column]):>9,} rows -> {sorted_index.index_path(args.data, column)}")
+    print(f"Indexes ready in {duration:.2f}s")
+
+def cmd_lookup(args):
+    dataset, _ = dataset_store.load_dataset(args.data)
+    index = sorted_index.load_or_build_indexes(dataset, args.data, [args.column])[args.column]
+
+    # ID values are compared as integers
+    convert = int if args.column in ColumnarDataset.INTEGER_COLUMNS else str
+    start = time.perf_counter()
+    if args.prefix is not None:
+        if args.column in ColumnarDataset.INTEGER_COLUMNS:
+            raise SystemExit(f"--prefix only works on text columns, use --range for {args.column}")
+        rows = index.lookup_prefix(args.prefix)
+    elif args.range is not None:
+        rows = index.lookup_range(convert(args.range[0]), convert(args.range[1]))
+    else:
+        rows = index.lookup(convert(args.value))
+    duration = time.perf_counter() - start
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(ColumnarDataset.COLUMNS)
+    for row in rows[:args.limit] if args.limit else rows:
+        record = dataset.record(row)
+        writer.writerow([record[column] for column in ColumnarDataset.COLUMNS])
+    print(f"{len(rows):,} matching rows in {duration * 1000:.3f} ms", file=sys.stderr)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Sorting Algorithm Stress Test - command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser("bench", help="time algorithms x columns x sizes and print JSON/CSV results")
+    bench.add_argument("--data", default=dataset_store.DEFAULT_DATA_PATH, help="CSV dataset to load")
+    bench.add_argument("--algorithms", nargs="+", metavar="NAME",
+                       help="algorithms to run (default: all); quote names with spaces")
+    bench.add_argument("--columns", nargs="+", default=list(ColumnarDataset.COLUMNS),
+                       choices=ColumnarDataset.COLUMNS, help="columns to sort by (default: all)")
+    bench.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000], help="dataset sizes (default: 1000 10000)")
+    bench.add_argument("--repeat", type=int, default=5, help="timed runs per combination (default 5)")
+    bench.add_argument("--warmup", type=int, default=1, help="untimed runs first (default 1)")
+    bench.add_argument("--descending", action="store_true", help="sort largest first")
+    bench.add_argument("--timeout", type=float, default=None,
+                       help="give up on a combination once one run takes longer than this many seconds")
+    bench.add_argument("--format", choices=["json", "csv"], default="json", help="result format (default json)")
+    bench.add_argument("--output", help="write results to this file instead of stdout")
+    bench.add_argument("--quiet", action="store_true", help="don't print progress lines to stderr")
+    bench.add_argument("--baseline", action="store_true",
+                       help="also run the NumPy native baseline and report each algorithm against it")
+    bench.add_argument("--tune-hybrid", action="store_true",
+                       help="measure Hybrid Merge Sort's insertion sort cutoff on this machine first")
+    bench.add_argument("--count-ops", action="store_true",
+                       help="also count comparisons, moves, key lookups and peak memory (one extra, untimed run each)")
+    bench.add_argument("--extrapolate-above", type=float, metavar="SECONDS",
+                       help="predict every combination from this machine's calibration and only report "
+                            "the prediction for those expected to take longer than SECONDS")
+    bench.set_defaults(func=cmd_bench)
+
+    tune = commands.add_parser("tune", help="find the best Hybrid Merge Sort cutoff for each column")
+    tune.add_argument("--data", default=dataset_store.DEFAULT_DATA_PATH, help="CSV dataset to sample")
+    tune.add_argument("--columns", nargs="+", default=list(ColumnarDataset.COLUMNS),
+                      choices=ColumnarDataset.COLUMNS, help="columns to tune (default: all)")
+    tune.set_defaults(func=cmd_tune)
+
+    calibrate = commands.add_parser("calibrate", help="fit a runtime model per algorithm on this machine and predict big n")
+    calibrate.add_argument("--data", default=dataset_store.DEFAULT_DATA_PATH, help="CSV dataset to sample")
+    calibrate.add_argument("--algorithms", nargs="+", metavar="NAME", help="algorithms to calibrate (default: all)")
+    calibrate.add_argument("--columns", nargs="+", default=list(ColumnarDataset.COLUMNS),
+                           choices=ColumnarDataset.COLUMNS, help="columns to calibrate (default: all)")
+    calibrate.add_argument("--recalibrate", action="store_true", help="measure again even if a saved fit exists")
+    calibrate.add_argument("--predict", nargs="+", type=int, default=[10000, 100000], metavar="N",
+                           help="sizes to predict (default: 10000 100000)")
+    calibrate.add_argument("--calibration-file", default=calibration.CALIBRATION_PATH,
+                           help="where the fits are saved (default: data/calibration.json)")
+    calibrate.set_defaults(func=cmd_calibrate)
+
+    index = commands.add_parser("index", help="build (or refresh) the saved sorted index of each column")
+    index.add_argument("--data", default=dataset_store.DEFAULT_DATA_PATH, help="CSV dataset to index")
+    index.add_argument("--columns", nargs="+", default=list(ColumnarDataset.COLUMNS),
+                       choices=ColumnarDataset.COLUMNS, help="columns to index (default: all)")
+    index.add_argument("--rebuild", action="store_true", help="rebuild even if the saved index is up to date")
+    index.set_defaults(func=cmd_index)
+
+    lookup = commands.add_parser("lookup", help="find rows by value, range or prefix using the sorted index")
+    lookup.add_argument("--data", default=dataset_store.DEFAULT_DATA_PATH, help="CSV dataset to search")
+    lookup.add_argument("--column", required=True, choices=ColumnarDataset.COLUMNS, help="column to search")
+    query = lookup.add_mutually_exclusive_group(required=True)
+    query.add_argument("--value", help="rows equal to this value")
+    query.add_argument("--range", nargs=2, metavar=("LOW", "HIGH"), help="rows with LOW <= value <= HIGH")
+    query.add_argument("--prefix", help="rows whose name starts with this text (FirstName/LastName)")
+    lookup.add_argument("--limit", type=int, default=20, help="most rows to print, 0 = all (default 20)")
+    lookup.set_defaults(func=cmd_lookup)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
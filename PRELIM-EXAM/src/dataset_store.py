@@ -0,0 +1,343 @@
+"""
+Dataset Store - DAA Prelim Exam
+Column-by-column storage for the ID / FirstName / LastName dataset
+"""
+
+import csv
+import hashlib
+import itertools
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# The dataset that ships with the project (data/generated_data.csv)
+DEFAULT_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'generated_data.csv'
+)
+
+# Sidecar cache file written next to the CSV (e.g. generated_data.csv.colcache)
+CACHE_SUFFIX = ".colcache"
+
+# Magic bytes + byte order, since the cache stores the arrays in native format
+CACHE_MAGIC = b"DAACOL1" + (b"L" if sys.byteorder == "little" else b"B")
+
+# Header after the magic: file size, mtime_ns, sample hash, row count,
+# then (distinct count, vocabulary bytes) for FirstName and for LastName
+CACHE_HEADER = struct.Struct("<qq16sqqqqq")
+
+# How much of the CSV to parse per chunk (keeps memory bounded on huge files)
+CHUNK_BYTES = 8 * 1024 * 1024
+
+# Source of dataset version numbers (unique across every store in the process)
+_versions = itertools.count(1)
+
+class ColumnarDataset:
+    """
+    Keeps the dataset as columns instead of one dict per row
+      * ID is an array('q') of 8-byte integers
+      * FirstName / LastName are dictionary-encoded: every distinct name is
+        stored once, and each row only keeps a 4-byte code pointing at it
+    The ID and the two codes are 16 bytes per row, excluding the name dictionaries.
+    Those grow with the number of distinct names, so with mostly unique names
+    expect 40-50 bytes per row in total - still far less than a dict per row
+    """
+
+    INTEGER_COLUMNS = ("ID",)
+    TEXT_COLUMNS = ("FirstName", "LastName")
+    COLUMNS = INTEGER_COLUMNS + TEXT_COLUMNS
+
+    def __init__(self):
+        self.ids = array('q')
+        self.values = {column: [] for column in self.TEXT_COLUMNS}      # code -> name
+        self.codes = {column: array('I') for column in self.TEXT_COLUMNS}  # row -> code
+        self._code_of = {column: {} for column in self.TEXT_COLUMNS}    # name -> code
+        self._mmap = None  # Keeps a memory-mapped cache file open while we use it
+        self.version = next(_versions)  # Changes whenever rows are added, so caches can tell
+
+    @classmethod
+    def from_columns(cls, ids, values, codes, mapped=None):
+        """
+        Wraps ready-made columns (arrays or memoryviews over a mapped cache file)
+        A store built over memoryviews is read-only
+        """
+        store = cls()
+        store.ids = ids
+        store.values = values
+        store.codes = codes
+        store._code_of = {
+            column: {value: code for code, value in enumerate(names)}
+            for column, names in values.items()
+        }
+        store._mmap = mapped
+        return store
+
+    def append(self, record_id, first_name, last_name):
+        self.version = next(_versions)
+        self.ids.append(int(record_id))
+        self._append_text("FirstName", first_name)
+        self._append_text("LastName", last_name)
+
+    def append_record(self, record):
+        """
+        Adds a csv.DictReader row
+        """
+        self.append(record['ID'], record['FirstName'], record['LastName'])
+
+    def _append_text(self, column, value):
+        code_of = self._code_of[column]
+        code = code_of.get(value)
+        if code is None:
+            values = self.values[column]
+            code = len(values)
+            code_of[value] = code
+            values.append(value)
+        self.codes[column].append(code)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def record(self, i):
+        """
+        Builds the dict for one row (only done for rows that actually get shown)
+        """
+        return {
+            'ID': self.ids[i],
+            'FirstName': self.values['FirstName'][self.codes['FirstName'][i]],
+            'LastName': self.values['LastName'][self.codes['LastName'][i]],
+        }
+
+    def column(self, key, rows=None):
+        """
+        Returns the values of one column as a plain list (what the sorts compare),
+        for every row or just the given row numbers
+        """
+        if key in self.INTEGER_COLUMNS:
+            if rows is None:
+                return self.ids.tolist()
+            if isinstance(rows, range) and rows.step == 1:
+                return self.ids[rows.start:rows.stop].tolist()
+            ids = self.ids
+            return [ids[i] for i in rows]
+
+        if key not in self.values:
+            raise KeyError(f"Unknown column: {key}")
+        values = self.values[key]
+        codes = self.codes[key]
+        if rows is None:
+            return [values[c] for c in codes]
+        if isinstance(rows, range) and rows.step == 1:
+            return [values[c] for c in codes[rows.start:rows.stop]]
+        return [values[codes[i]] for i in rows]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Slicing is a zero-copy view over a range of row numbers
+            return RowView(self, range(len(self))[index])
+        return self.record(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.record(i)
+
+class RowView:
+    """
+    A read-only list of rows from a ColumnarDataset, without copying them
+    rows is either a range (a slice of the dataset) or an index permutation
+    (a sorted result); records are only built when they're read
+    """
+
+    def __init__(self, store, rows):
+        self.store = store
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowView(self.store, self.rows[index])
+        return self.store.record(self.rows[index])
+
+    def __iter__(self):
+        record = self.store.record
+        for i in self.rows:
+            yield record(i)
+
+    def column(self, key):
+        return self.store.column(key, self.rows)
+
+    def take(self, order):
+        """
+        Reorders the view by an index permutation (positions within this view)
+        """
+        rows = self.rows
+        if isinstance(rows, range) and rows.start == 0 and rows.step == 1:
+            return RowView(self.store, order)
+        return RowView(self.store, [rows[i] for i in order])
+
+
+def _fingerprint(path):
+    """
+    Cheap identity for a CSV file: size, mtime, and a hash of its first and last 64 KB
+    """
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        digest.update(file.read(65536))
+        if stat.st_size > 65536:
+            file.seek(max(stat.st_size - 65536, 65536))
+            digest.update(file.read())
+    return stat.st_size, stat.st_mtime_ns, digest.digest()
+
+def _ragged_line(lines, first_line, width):
+    """
+    Finds the file line number of the first row in a chunk that doesn't have width fields
+    """
+    reader = csv.reader(lines)
+    for row in reader:
+        if row and len(row) != width:
+            return first_line + reader.line_num - 1
+    return first_line
+
+def parse_csv(path):
+    """
+    Parses an ID,FirstName,LastName CSV in large chunks instead of row by row:
+    each chunk is split in one go, the IDs go through int() via map straight
+    into the array, and the names are dictionary-encoded with one dict lookup each
+    """
+    store = ColumnarDataset()
+    ids = store.ids
+
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        header = next(csv.reader([file.readline()]))
+        try:
+            positions = [header.index(column) for column in ColumnarDataset.COLUMNS]
+        except ValueError:
+            raise ValueError(f"CSV header must contain the columns {', '.join(ColumnarDataset.COLUMNS)}")
+        width = len(header)
+        line_number = 2  # First data line of the current chunk
+
+        while True:
+            lines = file.readlines(CHUNK_BYTES)
+            if not lines:
+                break
+            first_line = line_number
+            line_number += len(lines)
+
+            # Plain files split on commas, anything with quotes goes through csv
+            chunk = ''.join(lines)
+            if '"' in chunk:
+                rows = [row for row in csv.reader(lines) if row]
+            else:
+                rows = [line.split(',') for line in chunk.splitlines() if line]
+            if not rows:
+                continue
+
+            # zip would quietly cut every row down to the shortest one, so check first
+            if any(len(row) != width for row in rows):
+                bad = _ragged_line(lines, first_line, width)
+                raise ValueError(f"{path}, line {bad}: expected {width} fields")
+
+            columns = list(zip(*rows))
+            ids.extend(map(int, columns[positions[0]]))
+            for column, position in zip(ColumnarDataset.TEXT_COLUMNS, positions[1:]):
+                # setdefault hands out the next code to names it hasn't seen yet;
+                # dicts keep insertion order, so the new names are the tail of code_of
+                code_of = store._code_of[column]
+                values = store.values[column]
+                setdefault = code_of.setdefault
+                store.codes[column].extend([setdefault(value, len(code_of)) for value in columns[position]])
+                values.extend(itertools.islice(code_of, len(values), None))
+
+    return store
+
+def write_cache(store, cache_path, fingerprint):
+    """
+    Saves the columns in a binary file that load_cache can memory-map later
+    """
+    vocab = [
+        '\0'.join(store.values[column]).encode('utf-8')
+        for column in ColumnarDataset.TEXT_COLUMNS
+    ]
+    size, mtime_ns, sample_hash = fingerprint
+    header = CACHE_HEADER.pack(
+        size, mtime_ns, sample_hash, len(store),
+        len(store.values['FirstName']), len(vocab[0]),
+        len(store.values['LastName']), len(vocab[1])
+    )
+
+    # Write to a temp file first so a half-written cache is never picked up
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(CACHE_MAGIC)
+        file.write(header)
+        file.write(store.ids.tobytes())
+        for column in ColumnarDataset.TEXT_COLUMNS:
+            file.write(store.codes[column].tobytes())
+        for blob in vocab:
+            file.write(blob)
+    os.replace(temp_path, cache_path)
+
+def load_cache(cache_path, fingerprint):
+    """
+    Memory-maps a cache file written by write_cache
+    Returns None if there's no cache or it doesn't match the CSV anymore
+    """
+    try:
+        file = open(cache_path, 'rb')
+    except OSError:
+        return None
+
+    with file:
+        head = file.read(len(CACHE_MAGIC) + CACHE_HEADER.size)
+        if len(head) < len(CACHE_MAGIC) + CACHE_HEADER.size or not head.startswith(CACHE_MAGIC):
+            return None
+        size, mtime_ns, sample_hash, rows, first_count, first_bytes, last_count, last_bytes = \
+            CACHE_HEADER.unpack_from(head, len(CACHE_MAGIC))
+        if (size, mtime_ns, sample_hash) != fingerprint:
+            return None
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Column layout: ids (8 bytes each), FirstName codes, LastName codes, then the names
+    view = memoryview(mapped)
+    offset = len(head)
+    ids = view[offset:offset + rows * 8].cast('q')
+    offset += rows * 8
+    codes = {}
+    for column in ColumnarDataset.TEXT_COLUMNS:
+        codes[column] = view[offset:offset + rows * 4].cast('I')
+        offset += rows * 4
+
+    values = {}
+    for column, count, length in (("FirstName", first_count, first_bytes), ("LastName", last_count, last_bytes)):
+        names = bytes(view[offset:offset + length]).decode('utf-8').split('\0') if count else []
+        if len(names) != count:
+            return None
+        values[column] = names
+        offset += length
+
+    return ColumnarDataset.from_columns(ids, values, codes, mapped)
+
+def load_dataset(path, use_cache=True):
+    """
+    Loads the CSV, from its binary sidecar cache when that is still up to date
+    Returns (dataset, loaded_from_cache)
+    """
+    cache_path = path + CACHE_SUFFIX
+    fingerprint = _fingerprint(path)
+
+    if use_cache:
+        store = load_cache(cache_path, fingerprint)
+        if store is not None:
+            return store, True
+
+    store = parse_csv(path)
+    if use_cache:
+        try:
+            write_cache(store, cache_path, fingerprint)
+        except OSError:
+            # Read-only folder etc. - the cache is only an optimization
+            pass
+    return store, False
@@ -0,0 +1,218 @@
+"""
+External Sort - DAA Prelim Exam
+Sorts ID/FirstName/LastName CSV files that are too big to load into memory
+
+1. Read the CSV in chunks that fit the memory budget
+2. Sort each chunk with one of the sorting_algorithms and write it to a temp file (a "run")
+3. k-way merge the sorted runs into the output CSV
+"""
+
+import argparse
+import csv
+import heapq
+import operator
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import sorting_algorithms
+from dataset_store import ColumnarDataset
+from progress import throttle
+
+# Memory the in-memory sort needs per row on top of the row itself: its slots in the
+# chunk, key and index lists, the key and index ints, and merge sort's working lists
+SORT_BYTES_PER_ROW = 160
+
+# Most run files merged at once; more runs than this get merged in several passes
+MAX_MERGE_FAN_IN = 64
+
+def _key_reader(key, header):
+    """
+    Returns a function that pulls the sort key out of a CSV row (as int for ID)
+    """
+    try:
+        position = header.index(key)
+    except ValueError:
+        raise ValueError(f"Column '{key}' not found in CSV header {header}")
+
+    if key in ColumnarDataset.INTEGER_COLUMNS:
+        return lambda row: int(row[position])
+    return operator.itemgetter(position)
+
+def _row_bytes(row):
+    """
+    Memory one parsed CSV row takes: the row list plus its field strings
+    """
+    return sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+
+def _read_run(path, get_key):
+    """
+    Yields (key, row) from a sorted run file
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        for row in csv.reader(file):
+            yield get_key(row), row
+
+def _merge_runs(run_paths, output, get_key, descending, on_row):
+    """
+    k-way merges sorted run files into an open csv.writer
+    heapq.merge keeps ties in run order, and runs are in input order, so it stays stable
+    """
+    streams = [_read_run(path, get_key) for path in run_paths]
+    merged = heapq.merge(*streams, key=operator.itemgetter(0), reverse=descending)
+    for _, row in merged:
+        output.writerow(row)
+        if on_row() is False:
+            return False
+    return True
+
+def external_sort_csv(input_path, output_path, key, descending=False, memory_mb=64,
+                      algorithm="Merge Sort", progress_callback=None, cancel_event=None, temp_dir=None,
+                      deadline=None):
+    """
+    Sorts a CSV by one column using at most about memory_mb of memory for rows
+    (each row is measured as it is read, plus what sorting it costs)
+    Returns a dict with the number of rows and sorted runs, or None if cancelled
+    or still running after deadline seconds
+    """
+    index_sort = sorting_algorithms.ALGORITHMS[algorithm]
+    is_cancelled = sorting_algorithms.cancel_checker(cancel_event, deadline)
+    stop_at = None if deadline is None else time.perf_counter() + deadline
+
+    chunk_bytes = max(int(memory_mb * 1024 * 1024), 64 * 1024)
+    file_size = max(os.path.getsize(input_path), 1)
+
+    with tempfile.TemporaryDirectory(prefix="extsort_", dir=temp_dir) as work_dir:
+        run_paths = []
+        total_rows = 0
+        bytes_read = 0
+
+        # Phase 1: sorted runs (first half of the progress bar, by bytes read)
+        with open(input_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                raise ValueError(f"{input_path} is empty, expected a CSV header")
+            get_key = _key_reader(key, header)
+
+            while True:
+                chunk = []
+                chunk_size = 0   # Memory the chunk will take while it is sorted
+                chunk_chars = 0  # Its size in the file, for the progress bar
+                for row in reader:
+                    if not row:
+                        continue
+                    chunk.append(row)
+                    chunk_size += _row_bytes(row) + SORT_BYTES_PER_ROW
+                    chunk_chars += sum(len(field) for field in row) + len(row)
+                    if chunk_size >= chunk_bytes:
+                        break
+                if not chunk:
+                    break
+
+                if is_cancelled():
+                    return None
+
+                # Sort the chunk in memory with the usual index sort
+                remaining = None if stop_at is None else max(stop_at - time.perf_counter(), 0)
+                order = index_sort([get_key(row) for row in chunk], descending, None, cancel_event, remaining)
+                if order is None:
+                    return None
+
+                run_path = os.path.join(work_dir, f"run_{len(run_paths):05d}.csv")
+                with open(run_path, 'w', encoding='utf-8', newline='') as run_file:
+                    csv.writer(run_file).writerows(chunk[i] for i in order)
+                run_paths.append(run_path)
+                total_rows += len(chunk)
+
+                # Approximate: characters read (plus separators) stand in for bytes
+                bytes_read += chunk_chars
+                if progress_callback:
+                    progress_callback(min(bytes_read / file_size * 50, 50))
+
+        run_count = len(run_paths)
+
+        # Every row is merged once per pass: the extra passes below plus the final one
+        passes = 1
+        groups = run_count
+        while groups > MAX_MERGE_FAN_IN:
+            groups = -(-groups // MAX_MERGE_FAN_IN)
+            passes += 1
+
+        # Phase 2: merges (second half of the progress bar)
+        written = [0]
+
+        def on_row():
+            written[0] += 1
+            # Every CANCEL_CHECK_EVERY rows, check for STOP and update the progress bar
+            if written[0] % sorting_algorithms.CANCEL_CHECK_EVERY == 0:
+                if is_cancelled():
+                    return False
+                if progress_callback:
+                    progress_callback(min(50 + written[0] / max(total_rows * passes, 1) * 50, 99.9))
+            return True
+
+        # Too many runs to keep open at once: merge them in groups first
+        generation = 0
+        while len(run_paths) > MAX_MERGE_FAN_IN:
+            generation += 1
+            next_paths = []
+            for g in range(0, len(run_paths), MAX_MERGE_FAN_IN):
+                group_path = os.path.join(work_dir, f"merge_{generation}_{len(next_paths):05d}.csv")
+                with open(group_path, 'w', encoding='utf-8', newline='') as group_file:
+                    finished = _merge_runs(run_paths[g:g + MAX_MERGE_FAN_IN], csv.writer(group_file),
+                                           get_key, descending, on_row)
+                if not finished:
+                    return None
+                for path in run_paths[g:g + MAX_MERGE_FAN_IN]:
+                    os.remove(path)
+                next_paths.append(group_path)
+            run_paths = next_paths
+
+        with open(output_path, 'w', encoding='utf-8', newline='') as out_file:
+            writer = csv.writer(out_file)
+            writer.writerow(header)
+            finished = _merge_runs(run_paths, writer, get_key, descending, on_row)
+
+    if not finished:
+        # Don't leave a half-written output behind
+        os.remove(output_path)
+        return None
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return {'rows': total_rows, 'runs': run_count}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort a large ID/FirstName/LastName CSV with bounded memory")
+    parser.add_argument("input", help="CSV file to sort")
+    parser.add_argument("output", help="where to write the sorted CSV")
+    parser.add_argument("--key", default="ID", choices=ColumnarDataset.COLUMNS, help="column to sort by")
+    parser.add_argument("--descending", action="store_true", help="sort largest first")
+    parser.add_argument("--memory-mb", type=float, default=64, help="memory budget for rows (default 64)")
+    parser.add_argument("--algorithm", default="Merge Sort", choices=list(sorting_algorithms.ALGORITHMS),
+                        help="algorithm used to sort each in-memory chunk")
+    parser.add_argument("--temp-dir", default=None, help="folder for the temporary run files")
+    args = parser.parse_args(argv)
+
+    def show_progress(p):
+        print(f"\rProgress: {p:5.1f}%", end="", flush=True)
+
+    start = time.perf_counter()
+    try:
+        stats = external_sort_csv(
+            args.input, args.output, args.key, args.descending, args.memory_mb,
+            args.algorithm, progress_callback=throttle(show_progress), temp_dir=args.temp_dir
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    duration = time.perf_counter() - start
+    print()
+    print(f"Sorted {stats['rows']:,} rows by {args.key} in {duration:.2f}s "
+          f"({stats['runs']} sorted runs) -> {args.output}")
+
+if __name__ == "__main__":
+    main()
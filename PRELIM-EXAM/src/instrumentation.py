@@ -0,0 +1,185 @@
+"""
+Operation Counters - DAA Prelim Exam
+Counts what a sort actually does instead of how long it takes: key
+comparisons, moves, key lookups and auxiliary memory. The sort runs once
+more over instrumented keys (count_operations); a normal run only ever sees
+plain lists, so the counting costs nothing unless it is asked for
+
+What gets counted:
+  * comparisons - every <, <=, >, >=, == between two keys
+  * moves       - every index written into the permutation or a working list
+  * key_lookups - every key read out of the key list
+  * peak_bytes  - most auxiliary memory in use at once during the sort
+"""
+
+import tracemalloc
+
+class OpCounter:
+    """
+    Totals of one instrumented sort
+    """
+
+    FIELDS = ("comparisons", "moves", "key_lookups", "peak_bytes")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.key_lookups = 0
+        self.peak_bytes = 0
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return (f"OpCounter(comparisons={self.comparisons:,}, moves={self.moves:,}, "
+                f"key_lookups={self.key_lookups:,}, peak_bytes={self.peak_bytes:,})")
+
+class CountedKey:
+    """
+    Wraps one key and counts every comparison made with it
+    """
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counter.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        self.counter.comparisons += 1
+        return self.value != other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+class CountingList(list):
+    """
+    A list that counts its reads (key lists) or its writes (index lists)
+    Slices stay CountingLists, so the pieces a sort splits off are counted too
+    """
+
+    __slots__ = ("counter", "is_keys")
+
+    def __init__(self, iterable=(), counter=None, is_keys=False):
+        super().__init__(iterable)
+        self.counter = counter
+        self.is_keys = is_keys
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return CountingList(list.__getitem__(self, index), self.counter, self.is_keys)
+        if self.is_keys:
+            self.counter.key_lookups += 1
+        return list.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        if type(index) is slice:
+            value = value if isinstance(value, list) else list(value)
+            if not self.is_keys:
+                self.counter.moves += len(value)
+        elif not self.is_keys:
+            self.counter.moves += 1
+        list.__setitem__(self, index, value)
+
+    def __iter__(self):
+        # Walking the whole list reads every key once
+        if self.is_keys:
+            self.counter.key_lookups += len(self)
+        return list.__iter__(self)
+
+    def append(self, value):
+        if not self.is_keys:
+            self.counter.moves += 1
+        list.append(self, value)
+
+    def extend(self, values):
+        values = values if isinstance(values, list) else list(values)
+        if not self.is_keys:
+            self.counter.moves += len(values)
+        list.extend(self, values)
+
+def counter_of(values):
+    """
+    The OpCounter behind an instrumented list, or None for a plain one
+    """
+    if type(values) is CountingList:
+        return values.counter
+    return None
+
+def copy_keys(keys):
+    """
+    list(keys), except a copy of instrumented keys is still instrumented
+    """
+    if type(keys) is CountingList:
+        return keys[:]
+    return list(keys)
+
+def index_list(keys, n=None):
+    """
+    list(range(n)) (n defaults to len(keys)), counting its writes as moves
+    when keys is instrumented
+    """
+    if n is None:
+        n = len(keys)
+    if type(keys) is CountingList:
+        return CountingList(range(n), keys.counter)
+    return list(range(n))
+
+def key_type(key):
+    """
+    type(key), looking through a CountedKey
+    """
+    if type(key) is CountedKey:
+        return type(key.value)
+    return type(key)
+
+def count_operations(index_sort, keys, descending=False, compare=True, cancel_event=None, deadline=None):
+    """
+    Runs index_sort(keys, descending, ...) once over instrumented keys and
+    returns its OpCounter, or None if it was cancelled / timed out
+    compare=False hands the sort the raw key values (for sorts that do
+    arithmetic on them, like Radix Sort), so only lookups and moves are counted
+    Much slower than a normal run, so don't time it
+    """
+    counter = OpCounter()
+    values = [CountedKey(k, counter) for k in keys] if compare else keys
+    tracked = CountingList(values, counter, is_keys=True)
+
+    # Memory is measured from here on, so the wrappers above don't count
+    tracing = not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    try:
+        order = index_sort(tracked, descending, None, cancel_event, deadline)
+        if tracing:
+            counter.peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        if tracing:
+            tracemalloc.stop()
+
+    if order is None:
+        return None
+    return counter
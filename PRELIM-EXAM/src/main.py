@@ -3,13 +3,28 @@ from tkinter import ttk, messagebox
 import threading
 import time
 import os
-import csv
 import sys
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sorting_algorithms
+import dataset_store
+import sorted_index
+import calibration
+from dataset_store import ColumnarDataset
+from progress import ProgressChannel
+from sort_cache import PermutationCache
+from result_view import VirtualResultView
 
-DATA_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'generated_data.csv')
+DATA_FILE_PATH = dataset_store.DEFAULT_DATA_PATH
+
+# How often the UI reads the progress channel while a sort runs (~30 frames per second)
+PROGRESS_POLL_MS = 33
+
+# "Then By" entry that means no tie-breaker column
+NO_COLUMN = "(none)"
+
+# Ask before starting a sort that is predicted to take longer than this
+SLOW_RUN_SECONDS = 30
 
 class SortingBenchmarkApp(tk.Tk):
     def __init__(self):
@@ -36,14 +51,30 @@ class SortingBenchmarkApp(tk.Tk):
         
         self.configure(bg=self.colors['bg'])
         
-        self.dataset = []
+        self.dataset = ColumnarDataset()
         self.sorted_result = []
         self.is_data_ready = False
         self.stop_signal = threading.Event()
+        self.progress = ProgressChannel()
+        self.progress_polling = False
+        self.sort_cache = PermutationCache()
+        self.indexes = {}  # column -> SortedIndex, filled in after the dataset loads
+        self.predictor = calibration.RuntimePredictor()  # Fitted runtimes, saved per machine
         
         self.selected_algorithm = tk.StringVar(value="Merge Sort")
         self.selected_column = tk.StringVar(value="ID")
+        self.column_descending = tk.BooleanVar(value=False)
+        # Optional tie-breaker columns for a multi-key sort ("(none)" = unused)
+        self.then_by_columns = [tk.StringVar(value=NO_COLUMN), tk.StringVar(value=NO_COLUMN)]
+        self.then_by_descending = [tk.BooleanVar(value=False), tk.BooleanVar(value=False)]
         self.dataset_size = tk.StringVar(value="5000")
+        self.time_limit = tk.StringVar(value="")
+        self.benchmark_mode = tk.BooleanVar(value=False)
+        self.count_ops = tk.BooleanVar(value=False)
+        self.use_index = tk.BooleanVar(value=False)
+        self.top_k_only = tk.BooleanVar(value=False)
+        self.top_k = tk.StringVar(value="100")
+        self.top_k_method = tk.StringVar(value="Heap Top-K")
         
         # Animation control
         self.animation_running = False
@@ -84,21 +115,15 @@ class SortingBenchmarkApp(tk.Tk):
             fg=self.colors['text_dark']
         ).pack(anchor="w", pady=(0, 8))
         
-        algorithms = ["Merge Sort", "Bubble Sort", "Insertion Sort"]
-        for algo in algorithms:
-            rb = tk.Radiobutton(
-                config_section,
-                text=algo,
-                variable=self.selected_algorithm,
-                value=algo,
-                font=("Arial", 10),
-                bg=self.colors['card'],
-                fg=self.colors['text_light'],
-                selectcolor=self.colors['secondary'],
-                activebackground=self.colors['card'],
-                cursor="hand2"
-            )
-            rb.pack(anchor="w", pady=2)
+        # A dropdown instead of one radio button per algorithm, so the list can grow
+        self.algorithm_combo = ttk.Combobox(
+            config_section,
+            textvariable=self.selected_algorithm,
+            values=list(sorting_algorithms.ALGORITHMS),
+            state="readonly",
+            font=("Arial", 10)
+        )
+        self.algorithm_combo.pack(fill="x")
         
         tk.Label(
             config_section, text="Sort Column By",
@@ -107,14 +132,25 @@ class SortingBenchmarkApp(tk.Tk):
             fg=self.colors['text_dark']
         ).pack(anchor="w", pady=(15, 8))
         
-        column_combo = ttk.Combobox(
-            config_section,
-            textvariable=self.selected_column,
-            values=["ID", "FirstName", "LastName"],
-            state="readonly",
-            font=("Arial", 10)
-        )
-        column_combo.pack(fill="x", pady=(0, 15))
+        self._create_column_row(config_section, self.selected_column, self.column_descending,
+                                list(ColumnarDataset.COLUMNS))
+        
+        tk.Label(
+            config_section, text="Then By (ties)",
+            font=("Arial", 10, "bold"),
+            bg=self.colors['card'],
+            fg=self.colors['text_dark']
+        ).pack(anchor="w", pady=(10, 8))
+        
+        for column_var, descending_var in zip(self.then_by_columns, self.then_by_descending):
+            self._create_column_row(config_section, column_var, descending_var,
+                                    [NO_COLUMN] + list(ColumnarDataset.COLUMNS))
+        
+        for column_var in [self.selected_column] + self.then_by_columns:
+            column_var.trace_add("write", self._on_column_change)
+        self._on_column_change()
+        
+        tk.Frame(config_section, bg=self.colors['card'], height=10).pack()
         
         tk.Label(
             config_section, text="Number of Records (Dataset Size)",
@@ -158,6 +194,90 @@ class SortingBenchmarkApp(tk.Tk):
                 command=lambda v=value: self.dataset_size.set(v)
             ).pack(side="left", padx=3)
         
+        tk.Label(
+            config_section, text="Time Limit (seconds, blank = none)",
+            font=("Arial", 10, "bold"),
+            bg=self.colors['card'],
+            fg=self.colors['text_dark']
+        ).pack(anchor="w", pady=(15, 8))
+        
+        tk.Entry(
+            config_section,
+            textvariable=self.time_limit,
+            font=("Arial", 11),
+            bg="#FAFAFA",
+            fg=self.colors['text_dark'],
+            relief="solid",
+            bd=1
+        ).pack(fill="x", ipady=4)
+        
+        # Repeat runs are served from the result cache unless this is ticked
+        tk.Checkbutton(
+            config_section, text="Benchmark mode (always re-sort)",
+            variable=self.benchmark_mode,
+            font=("Arial", 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light'],
+            activebackground=self.colors['card'],
+            cursor="hand2"
+        ).pack(anchor="w", pady=(10, 0))
+        
+        # One extra instrumented run after the timed one, so the time stays honest
+        tk.Checkbutton(
+            config_section, text="Count operations (extra, slower run)",
+            variable=self.count_ops,
+            font=("Arial", 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light'],
+            activebackground=self.colors['card'],
+            cursor="hand2"
+        ).pack(anchor="w")
+        
+        # Single-column sorts read the rows in the order of the saved index instead of sorting
+        tk.Checkbutton(
+            config_section, text="Use saved column index",
+            variable=self.use_index,
+            font=("Arial", 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light'],
+            activebackground=self.colors['card'],
+            cursor="hand2"
+        ).pack(anchor="w")
+        
+        # Top K only: skip sorting the rest of the records, the table starts with the first k anyway
+        top_k_row = tk.Frame(config_section, bg=self.colors['card'])
+        top_k_row.pack(fill="x")
+        
+        tk.Checkbutton(
+            top_k_row, text="Top K only",
+            variable=self.top_k_only,
+            font=("Arial", 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light'],
+            activebackground=self.colors['card'],
+            cursor="hand2"
+        ).pack(side="left")
+        
+        tk.Entry(
+            top_k_row,
+            textvariable=self.top_k,
+            width=7,
+            font=("Arial", 9),
+            bg="#FAFAFA",
+            fg=self.colors['text_dark'],
+            relief="solid",
+            bd=1
+        ).pack(side="left", padx=(2, 6))
+        
+        ttk.Combobox(
+            top_k_row,
+            textvariable=self.top_k_method,
+            values=list(sorting_algorithms.TOP_K_ALGORITHMS),
+            state="readonly",
+            width=16,
+            font=("Arial", 9)
+        ).pack(side="left", fill="x", expand=True)
+        
         button_frame = tk.Frame(panel, bg=self.colors['sidebar'])
         button_frame.pack(pady=30)
         
@@ -190,6 +310,66 @@ class SortingBenchmarkApp(tk.Tk):
         
         return panel
         
+    def _create_column_row(self, parent, column_var, descending_var, values):
+        # Column dropdown with a "Desc" tick box next to it
+        row = tk.Frame(parent, bg=self.colors['card'])
+        row.pack(fill="x", pady=(0, 4))
+        
+        ttk.Combobox(
+            row,
+            textvariable=column_var,
+            values=values,
+            state="readonly",
+            width=16,
+            font=("Arial", 10)
+        ).pack(side="left", fill="x", expand=True)
+        
+        tk.Checkbutton(
+            row, text="Desc",
+            variable=descending_var,
+            font=("Arial", 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light'],
+            activebackground=self.colors['card'],
+            cursor="hand2"
+        ).pack(side="left", padx=(6, 0))
+        
+    def _sort_spec(self):
+        """List of (column, descending) pairs, primary column first"""
+        spec = [(self.selected_column.get(), self.column_descending.get())]
+        for column_var, descending_var in zip(self.then_by_columns, self.then_by_descending):
+            column = column_var.get()
+            # Skip unused and repeated columns (a repeat can never break a tie)
+            if column != NO_COLUMN and column not in [c for c, _ in spec]:
+                spec.append((column, descending_var.get()))
+        return spec
+        
+    def _unavailable_algorithms(self):
+        # Radix/Counting Sort only make sense for the integer ID column,
+        # String Radix Sort only for the text columns.
+        # A multi-key sort packs all its columns into one integer key, so it counts as integer
+        if self._prediction_column() in ColumnarDataset.INTEGER_COLUMNS:
+            return sorting_algorithms.STRING_KEY_ALGORITHMS
+        return sorting_algorithms.INTEGER_KEY_ALGORITHMS
+        
+    def _available_algorithms(self):
+        unavailable = self._unavailable_algorithms()
+        return [algo for algo in sorting_algorithms.ALGORITHMS if algo not in unavailable]
+        
+    def _prediction_column(self):
+        # Column whose timings stand in for the sort: multi-key sorts compare packed integers, like ID
+        spec = self._sort_spec()
+        return spec[0][0] if len(spec) == 1 else ColumnarDataset.INTEGER_COLUMNS[0]
+        
+    def _on_column_change(self, *args):
+        unavailable = self._unavailable_algorithms()
+        self.algorithm_combo.config(
+            values=[calibration.AUTO_ALGORITHM] + self._available_algorithms()
+        )
+        
+        if self.selected_algorithm.get() in unavailable:
+            self.selected_algorithm.set("Merge Sort")
+        
     def _create_content_panel(self, parent):
         # Create a canvas with scrollbar for the content panel
         canvas = tk.Canvas(parent, bg=self.colors['bg'], highlightthickness=0)
@@ -259,6 +439,24 @@ class SortingBenchmarkApp(tk.Tk):
         self.records_metric = self._create_metric_card(metrics_row, "Records Processed", "--", "records")
         self.records_metric.grid(row=0, column=1, sticky="ew")
         
+        # Operation counters (filled in when "Count operations" is ticked)
+        counters_row = tk.Frame(panel, bg=self.colors['bg'])
+        counters_row.pack(fill="x", padx=40, pady=(0, 25))
+        for column in range(4):
+            counters_row.grid_columnconfigure(column, weight=1)
+        
+        self.comparisons_metric = self._create_metric_card(counters_row, "Comparisons", "--", "key comparisons")
+        self.comparisons_metric.grid(row=0, column=0, sticky="ew", padx=(0, 15))
+        
+        self.moves_metric = self._create_metric_card(counters_row, "Swaps / Moves", "--", "index writes")
+        self.moves_metric.grid(row=0, column=1, sticky="ew", padx=(0, 15))
+        
+        self.lookups_metric = self._create_metric_card(counters_row, "Key Lookups", "--", "keys read")
+        self.lookups_metric.grid(row=0, column=2, sticky="ew", padx=(0, 15))
+        
+        self.memory_metric = self._create_metric_card(counters_row, "Auxiliary Memory", "--", "peak KiB")
+        self.memory_metric.grid(row=0, column=3, sticky="ew")
+        
         progress_section = tk.Frame(panel, bg=self.colors['card'], padx=20, pady=15)
         progress_section.pack(fill="x", padx=40, pady=(0, 20))
         
@@ -292,37 +490,57 @@ class SortingBenchmarkApp(tk.Tk):
         results_section = tk.Frame(panel, bg=self.colors['card'], padx=20, pady=20)
         results_section.pack(fill="both", expand=True, padx=40, pady=(0, 20))
         
+        results_header = tk.Frame(results_section, bg=self.colors['card'])
+        results_header.pack(fill="x", pady=(0, 10))
+        
         tk.Label(
-            results_section, text="First 100 Sorted Datasets",
+            results_header, text="Sorted Datasets",
             font=("Arial", 11, "bold"),
             bg=self.colors['card'],
             fg=self.colors['text_dark']
-        ).pack(anchor="w", pady=(0, 10))
-        
-        tree_frame = tk.Frame(results_section, bg=self.colors['card'])
-        tree_frame.pack(fill="both", expand=True)
-        
-        tree_scroll = tk.Scrollbar(tree_frame)
-        tree_scroll.pack(side="right", fill="y")
+        ).pack(side="left")
         
-        self.results_tree = ttk.Treeview(
-            tree_frame,
-            columns=("ID", "FirstName", "LastName"),
-            show="headings",
-            yscrollcommand=tree_scroll.set,
-            height=15
+        self.results_range_label = tk.Label(
+            results_header, text="",
+            font=("Arial", 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
         )
+        self.results_range_label.pack(side="left", padx=(10, 0))
         
-        self.results_tree.heading("ID", text="ID")
-        self.results_tree.heading("FirstName", text="First Name")
-        self.results_tree.heading("LastName", text="Last Name")
-        
-        self.results_tree.column("ID", width=120, anchor="w")
-        self.results_tree.column("FirstName", width=200, anchor="w")
-        self.results_tree.column("LastName", width=200, anchor="w")
+        # Jump-to-key (binary search on the sort column) and jump-to-row, right-aligned
+        self.jump_key = tk.StringVar()
+        self.jump_row = tk.StringVar()
+        for label, variable, command in [("Find", self.jump_key, self._jump_to_key),
+                                         ("Go to row", self.jump_row, self._jump_to_row)]:
+            tk.Button(
+                results_header, text=label,
+                font=("Arial", 8, "bold"),
+                bg=self.colors['secondary'],
+                fg="white",
+                bd=0,
+                padx=10,
+                pady=4,
+                cursor="hand2",
+                command=command
+            ).pack(side="right", padx=(3, 10))
+            entry = tk.Entry(
+                results_header,
+                textvariable=variable,
+                width=14,
+                font=("Arial", 10),
+                bg="#FAFAFA",
+                fg=self.colors['text_dark'],
+                relief="solid",
+                bd=1
+            )
+            entry.pack(side="right", ipady=2)
+            entry.bind("<Return>", lambda e, c=command: c())
         
-        self.results_tree.pack(side="left", fill="both", expand=True)
-        tree_scroll.config(command=self.results_tree.yview)
+        # Only the rows on screen are real Treeview items, so any n scrolls smoothly
+        self.result_view = VirtualResultView(results_section, visible_rows=15, bg=self.colors['card'])
+        self.result_view.pack(fill="both", expand=True)
+        self.result_view.on_scroll = self._on_results_scroll
         
         # Dataset Preview section at the bottom (same width as other sections)
         preview_section = tk.Frame(panel, bg=self.colors['card'], padx=20, pady=15)
@@ -417,32 +635,34 @@ class SortingBenchmarkApp(tk.Tk):
         try:
             start_time = time.perf_counter()
             
-            with open(DATA_FILE_PATH, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                for row in reader:
-                    try:
-                        row['ID'] = int(row['ID'])
-                    except (ValueError, KeyError):
-                        pass
-                    self.dataset.append(row)
+            # Parses the CSV in bulk the first time, then memory-maps the binary cache
+            self.dataset, from_cache = dataset_store.load_dataset(DATA_FILE_PATH)
             
             load_duration = time.perf_counter() - start_time
             self.is_data_ready = True
+            source = "from cache" if from_cache else "from CSV"
             
             self.after(0, lambda: self._update_status(
-                f"Dataset loaded: {len(self.dataset):,} items was loaded in approximately {load_duration:.2f}s | ദ്ദി(ᵔᗜᵔ)"
+                f"Dataset loaded: {len(self.dataset):,} items was loaded {source} in approximately {load_duration:.2f}s | ദ്ദി(ᵔᗜᵔ)"
             ))
             self.after(0, lambda: self.size_hint.config(
                 text=f"Available: 1 to {len(self.dataset):,}"
             ))
             self.after(0, self._display_preview)
             
+            # Sorted index per column: loaded from disk, or built and saved the first time
+            index_start = time.perf_counter()
+            self.indexes = sorted_index.load_or_build_indexes(self.dataset, DATA_FILE_PATH)
+            index_duration = time.perf_counter() - index_start
+            self.after(0, lambda: self.size_hint.config(
+                text=f"Available: 1 to {len(self.dataset):,} | column indexes ready in {index_duration:.2f}s"
+            ))
+            
         except Exception as e:
             self.after(0, lambda: self._update_status(f"Error: {str(e)}"))
             
     def _display_preview(self):
-        if not self.dataset:
+        if not len(self.dataset):
             return
             
         self.preview_text.config(state="normal")
@@ -467,9 +687,26 @@ class SortingBenchmarkApp(tk.Tk):
         self.subtitle_label.config(text=message)
         
     def _update_progress(self, value):
-        self.after(0, lambda: self.progress_bar.config(value=value))
+        # Called from the sort thread: just store the value, the UI picks it up in _poll_progress
+        self.progress.report(value)
+        
+    def _poll_progress(self):
+        """Copy the latest progress value into the progress bar, once per frame"""
+        if not self.progress_polling:
+            return
+        
+        self.progress_bar['value'] = self.progress.value
+        self.after(PROGRESS_POLL_MS, self._poll_progress)
         
-    def _execute_benchmark(self):
+    def _start_progress_polling(self):
+        self.progress.reset()
+        self.progress_polling = True
+        self._poll_progress()
+        
+    def _stop_progress_polling(self):
+        self.progress_polling = False
+        
+    def _execute_benchmark(self, calibrated=False):
         if not self.is_data_ready:
             messagebox.showerror("Error", "Dataset not loaded (ㆆ_ㆆ)")
             return
@@ -491,15 +728,53 @@ class SortingBenchmarkApp(tk.Tk):
                 messagebox.showerror("Invalid Input", "Enter a valid number or 'MAX' (ㆆ_ㆆ)")
                 return
         
+        limit_input = self.time_limit.get().strip()
+        time_limit = None
+        if limit_input:
+            try:
+                time_limit = float(limit_input)
+                if time_limit <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Invalid Input", "Time limit must be a positive number of seconds (ㆆ_ㆆ)")
+                return
+        
+        top_k = None
+        if self.top_k_only.get():
+            try:
+                k = int(self.top_k.get().strip())
+                if k <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Invalid Input", "K must be a positive whole number (ㆆ_ㆆ)")
+                return
+            top_k = (self.top_k_method.get(), min(k, n))
+        
         algorithm = self.selected_algorithm.get()
-        column = self.selected_column.get()
+        spec = self._sort_spec()
+        
+        column = self._prediction_column()
         
-        if n > 15000 and algorithm in ["Bubble Sort", "Insertion Sort"]:
-            if not self._show_warning(algorithm, n):
+        # Auto is resolved in the sort thread, calibrating any algorithm it hasn't timed yet.
+        # Runs the cache or the saved index answer don't sort, so there's nothing to predict
+        if (top_k is None and algorithm != calibration.AUTO_ALGORITHM
+                and not self._served_without_sorting(n, algorithm, spec)):
+            if self.predictor.fit(algorithm, column) is None and not calibrated:
+                # Calibrate in the background first, then come back here with the fit
+                self._calibrate_then_run(algorithm, column)
                 return
+            seconds = self.predictor.predict(self.dataset, algorithm, column, n, calibrate=False)
+            if seconds is not None and seconds > SLOW_RUN_SECONDS:
+                choice = self._show_warning(algorithm, n, seconds)
+                if choice is None:
+                    return
+                if not choice:
+                    self._show_prediction(algorithm, n, seconds)
+                    return
         
         self.stop_signal.clear()
         self.progress_bar['value'] = 0
+        self._start_progress_polling()
         
         self.run_btn.config(state="disabled", text="RUNNING...")
         self.stop_btn.config(state="normal")
@@ -510,12 +785,19 @@ class SortingBenchmarkApp(tk.Tk):
         self._update_status("Executing benchmark... /ᐠ - ˕ -マ ᶻ 𝗓 𐰁")
         self.title_label.config(text="Benchmark In Progress")
         
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.result_view.clear()
+        
+        # Auto picks from these in the sort thread (Tk variables can only be read here)
+        auto = None
+        if algorithm == calibration.AUTO_ALGORITHM and top_k is None:
+            candidates = [algo for algo in self._available_algorithms()
+                          if algo != sorting_algorithms.native_backend.NATIVE_BASELINE]
+            auto = (column, candidates)
         
         threading.Thread(
             target=self._run_sort,
-            args=(n, algorithm, column),
+            args=(n, algorithm, spec, time_limit, self.benchmark_mode.get(), self.use_index.get(), top_k,
+                  self.count_ops.get(), auto),
             daemon=True
         ).start()
         
@@ -523,31 +805,60 @@ class SortingBenchmarkApp(tk.Tk):
         self.stop_signal.set()
         self._update_status("Cancelling... /ᐠ - ˕ -マ ᶻ 𝗓 𐰁")
         
-    def _run_sort(self, n, algorithm, column):
-        subset = list(self.dataset[:n])
+    def _run_sort(self, n, algorithm, spec, time_limit=None, benchmark_mode=False, use_index=False, top_k=None,
+                  count_ops=False, auto=None):
+        # Zero-copy view over the first n rows
+        subset = self.dataset[:n]
         
         start = time.perf_counter()
         result = None
         
         try:
-            if algorithm == "Bubble Sort":
-                result = sorting_algorithms.bubble_sort(
-                    subset, column,
-                    progress_callback=self._update_progress,
-                    cancel_event=self.stop_signal
-                )
-            elif algorithm == "Insertion Sort":
-                result = sorting_algorithms.insertion_sort(
-                    subset, column,
-                    progress_callback=self._update_progress,
-                    cancel_event=self.stop_signal
-                )
-            elif algorithm == "Merge Sort":
-                result = sorting_algorithms.merge_sort(
-                    subset, column,
+            source = None
+            method = algorithm
+            if top_k is not None:
+                # Only the first k records (the cache and the index hold full orders)
+                method, k = top_k
+                algorithm = f"{method} (k = {k:,})"
+                order = sorting_algorithms.top_k_order(
+                    method, subset, spec, k,
                     progress_callback=self._update_progress,
-                    cancel_event=self.stop_signal
+                    cancel_event=self.stop_signal,
+                    deadline=time_limit
                 )
+                source = "top-k"
+            else:
+                # Benchmark mode skips the cache and the index so the time is a real sort
+                order = None
+                if not benchmark_mode and algorithm != calibration.AUTO_ALGORITHM:
+                    order = self.sort_cache.get(self.dataset, n, spec, algorithm)
+                if order is not None:
+                    source = "cache"
+                elif not benchmark_mode and use_index and len(spec) == 1 and spec[0][0] in self.indexes:
+                    column, descending = spec[0]
+                    order = self.indexes[column].order(n, descending)
+                    source = "saved index"
+                else:
+                    if algorithm == calibration.AUTO_ALGORITHM:
+                        algorithm = method = self._pick_fastest(n, *auto)
+                        if algorithm is None:
+                            # STOP was pressed while calibrating
+                            self.after(0, lambda: self._handle_cancellation(None))
+                            return
+                        # Calibrating the candidates isn't part of the sort time
+                        start = time.perf_counter()
+                        if not benchmark_mode:
+                            order = self.sort_cache.get(self.dataset, n, spec, algorithm)
+                            source = "cache" if order is not None else None
+                if source is None:
+                    order = sorting_algorithms.sort_order(
+                        algorithm, subset, spec,
+                        progress_callback=self._update_progress,
+                        cancel_event=self.stop_signal,
+                        deadline=time_limit
+                    )
+            if order is not None:
+                result = sorting_algorithms.apply_order(subset, order)
         except Exception as e:
             self.after(0, lambda: self._handle_error(str(e)))
             return
@@ -555,60 +866,163 @@ class SortingBenchmarkApp(tk.Tk):
         duration = time.perf_counter() - start
         
         if result is None:
-            self.after(0, self._handle_cancellation)
+            # No STOP press means the time limit ran out
+            timed_out = None if self.stop_signal.is_set() else time_limit
+            self.after(0, lambda: self._handle_cancellation(timed_out))
         else:
+            if source is None:
+                # Fresh full sort: remember the order for repeat runs
+                self.sort_cache.put(self.dataset, n, spec, algorithm, order)
             self.sorted_result = result
-            self.after(0, lambda: self._display_results(result, duration, n, algorithm, column))
             
-    def _display_results(self, data, duration, n, algorithm, column):
-        # Stop the animation
+            # The cache and the index didn't sort anything, so there is nothing to count
+            counts = None
+            if count_ops and source in (None, "top-k"):
+                counts = self._count_operations(subset, method, spec, top_k, time_limit)
+            self.after(0, lambda: self._display_results(result, duration, n, algorithm, spec, source, counts))
+    
+    def _served_without_sorting(self, n, algorithm, spec):
+        # The saved index or a cached order answers the run (same checks as _run_sort)
+        if self.benchmark_mode.get():
+            return False
+        if self.use_index.get() and len(spec) == 1 and spec[0][0] in self.indexes:
+            return True
+        return self.sort_cache.covers(self.dataset, n, spec, algorithm)
+        
+    def _calibrate_then_run(self, algorithm, column):
+        # Calibrating takes a second or two per algorithm, so it runs in its own thread
+        self.stop_signal.clear()
+        self.run_btn.config(state="disabled", text="CALIBRATING...")
+        self.stop_btn.config(state="normal")
+        self._update_status(f"Calibrating {algorithm} on this machine (only needed once)... /ᐠ - ˕ -マ ᶻ 𝗓 𐰁")
+        
+        def calibrate():
+            self.predictor.calibrate(self.dataset, algorithm, column, cancel_event=self.stop_signal)
+            self.after(0, finished)
+            
+        def finished():
+            self.run_btn.config(state="normal", text="START BENCHMARK")
+            self.stop_btn.config(state="disabled")
+            if self.stop_signal.is_set():
+                self._update_status("Calibration cancelled (ㆆ_ㆆ)")
+                return
+            self._execute_benchmark(calibrated=True)
+            
+        threading.Thread(target=calibrate, daemon=True).start()
+        
+    def _pick_fastest(self, n, column, candidates):
+        # Runs in the sort thread: calibrating every algorithm the first time takes a little while
+        self.after(0, lambda: self._update_status("Picking the fastest algorithm for this machine... /ᐠ - ˕ -マ ᶻ 𝗓 𐰁"))
+        fastest = self.predictor.fastest(self.dataset, column, n, candidates, cancel_event=self.stop_signal)
+        if self.stop_signal.is_set():
+            return None
+        if fastest is None:
+            return "Merge Sort"
+        algorithm, _ = fastest
+        self.after(0, lambda: self._update_status(f"Auto picked {algorithm}, sorting... /ᐠ - ˕ -マ ᶻ 𝗓 𐰁"))
+        return algorithm
+        
+    def _count_operations(self, subset, method, spec, top_k, time_limit):
+        # Runs the sort again over instrumented keys, returns None if it can't be counted
+        self.after(0, lambda: self._update_status("Counting operations (instrumented run)... /ᐠ - ˕ -マ ᶻ 𝗓 𐰁"))
+        try:
+            return sorting_algorithms.count_operations(
+                method, subset, spec,
+                k=top_k[1] if top_k is not None else None,
+                cancel_event=self.stop_signal,
+                deadline=time_limit
+            )
+        except ValueError:
+            # e.g. the native baseline, which sorts inside NumPy
+            return None
+            
+    def _display_results(self, data, duration, n, algorithm, spec, source=None, counts=None):
+        # Stop the animation and the progress polling
         self._stop_animation()
+        self._stop_progress_polling()
         
         self.run_btn.config(state="normal", text="START BENCHMARK")
         self.stop_btn.config(state="disabled")
         
         self.title_label.config(text="Benchmark Complete")
-        self._update_status(f"Sorted {n:,} records by {column} using {algorithm} ദ്ദി(ᵔᗜᵔ)")
+        order_by = ", then ".join(f"{column} ({'desc' if descending else 'asc'})" for column, descending in spec)
+        how = f"from the {source}" if source in ("cache", "saved index") else f"using {algorithm}"
+        what = f"the first {len(data):,} of {n:,}" if len(data) < n else f"{n:,}"
+        self._update_status(f"Sorted {what} records by {order_by} {how} ദ്ദി(ᵔᗜᵔ)")
         
         self.progress_bar['value'] = 100
         
         self._update_metric(self.time_metric, f"{duration:.4f}", "seconds")
         self._update_metric(self.records_metric, f"{n:,}", "records")
-        
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        for i, record in enumerate(data[:100]):
-            tag = "even" if i % 2 == 0 else "odd"
-            self.results_tree.insert("", "end", values=(
-                record.get('ID', 'N/A'),
-                record.get('FirstName', 'N/A'),
-                record.get('LastName', 'N/A')
-            ), tags=(tag,))
+        self._show_counts(counts)
         
         style = ttk.Style()
         style.configure("Treeview", rowheight=25, background=self.colors['card'], foreground=self.colors['text_dark'])
-        self.results_tree.tag_configure("even", background="#FFFFFF")
-        self.results_tree.tag_configure("odd", background="#F9F7FC")
+        self.result_view.tree.tag_configure("even", background="#FFFFFF")
+        self.result_view.tree.tag_configure("odd", background="#F9F7FC")
         
-    def _handle_cancellation(self):
-        # Stop the animation
+        # Jump-to-key searches the most significant sort column
+        key, descending = spec[0]
+        self.result_view.set_rows(data, key, descending)
+        
+    def _on_results_scroll(self, first, last, total):
+        if total:
+            self.results_range_label.config(text=f"rows {first + 1:,}-{last:,} of {total:,}")
+        else:
+            self.results_range_label.config(text="")
+        
+    def _jump_to_row(self):
+        try:
+            row = int(self.jump_row.get().replace(",", ""))
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Enter a row number (ㆆ_ㆆ)")
+            return
+        self.result_view.jump_to_row(row - 1)
+        
+    def _jump_to_key(self):
+        value = self.jump_key.get().strip()
+        if not value or not len(self.result_view.rows):
+            return
+        try:
+            self.result_view.jump_to_key(value)
+        except ValueError:
+            messagebox.showerror("Invalid Input", f"{self.result_view.key} values are whole numbers (ㆆ_ㆆ)")
+        
+    def _handle_cancellation(self, timed_out=None):
+        # Stop the animation and the progress polling
         self._stop_animation()
+        self._stop_progress_polling()
         
         self.run_btn.config(state="normal", text="START BENCHMARK")
         self.stop_btn.config(state="disabled")
         
-        self.title_label.config(text="Benchmark Cancelled")
-        self._update_status("Operation cancelled by user (╭ರ_•́)?")
+        if timed_out is not None:
+            self.title_label.config(text="Benchmark Timed Out")
+            self._update_status(f"Stopped after the {timed_out:g}s time limit (╭ರ_•́)?")
+        else:
+            self.title_label.config(text="Benchmark Cancelled")
+            self._update_status("Operation cancelled by user (╭ರ_•́)?")
         
         self.progress_bar['value'] = 0
         
         self._update_metric(self.time_metric, "--", "seconds")
         self._update_metric(self.records_metric, "--", "records")
+        self._show_counts(None)
+        
+    def _show_counts(self, counts):
+        if counts is None:
+            for card in (self.comparisons_metric, self.moves_metric, self.lookups_metric, self.memory_metric):
+                self._update_metric(card, "--")
+            return
+        self._update_metric(self.comparisons_metric, f"{counts.comparisons:,}")
+        self._update_metric(self.moves_metric, f"{counts.moves:,}")
+        self._update_metric(self.lookups_metric, f"{counts.key_lookups:,}")
+        self._update_metric(self.memory_metric, f"{counts.peak_bytes / 1024:,.0f}")
         
     def _handle_error(self, error_msg):
-        # Stop the animation
+        # Stop the animation and the progress polling
         self._stop_animation()
+        self._stop_progress_polling()
         
         self.run_btn.config(state="normal", text="START BENCHMARK")
         self.stop_btn.config(state="disabled")
@@ -618,32 +1032,28 @@ class SortingBenchmarkApp(tk.Tk):
         
         messagebox.showerror("Benchmark Error (ㆆ_ㆆ)", error_msg)
         
-    def _show_warning(self, algorithm, n):
-        import math
-        
-        if algorithm == "Bubble Sort":
-            ops = n * n
-            ops_per_sec = 5000000
-        else:
-            ops = (n * n) / 2
-            ops_per_sec = 7500000
+    def _show_warning(self, algorithm, n, seconds):
+        # True = run it, False = just show the prediction, None = go back
+        fit = self.predictor.fit(algorithm, self._prediction_column())
+        model = f" ({fit['model']} fit measured on this machine)" if fit else ""
         
-        seconds = ops / ops_per_sec
-        
-        if seconds < 60:
-            time_str = f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            time_str = f"{seconds/60:.1f} minutes"
-        else:
-            time_str = f"{seconds/3600:.1f} hours"
-        
-        response = messagebox.askyesno(
+        return messagebox.askyesnocancel(
             "Performance Warning!",
-            f"{algorithm} with {n:,} recorded data may take approximately {time_str} to sort.   Σ(°ロ°)\n\n"
-            f"Would you like to continue anyway? "
+            f"{algorithm} with {n:,} recorded data may take approximately "
+            f"{calibration.format_duration(seconds)} to sort{model}.   Σ(°ロ°)\n\n"
+            f"Yes: run it anyway\n"
+            f"No: show the predicted time instead of running it"
         )
         
-        return response
+    def _show_prediction(self, algorithm, n, seconds):
+        # Extrapolated result for a run that would take too long to actually do
+        self.title_label.config(text="Runtime Predicted")
+        self._update_status(f"{algorithm} on {n:,} records would take about "
+                            f"{calibration.format_duration(seconds)} (predicted, not run) ദ്ദി(ᵔᗜᵔ)")
+        self._update_metric(self.time_metric, f"~{seconds:,.1f}", "seconds (predicted)")
+        self._update_metric(self.records_metric, f"{n:,}", "records")
+        self._show_counts(None)
+        self.result_view.clear()
 
 if __name__ == "__main__":
     app = SortingBenchmarkApp()
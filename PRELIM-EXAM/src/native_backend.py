@@ -0,0 +1,47 @@
+"""
+Native Baseline - DAA Prelim Exam
+NumPy's compiled stable sort, as a production-speed reference to compare
+the from-scratch algorithms against. NumPy is optional: without it this
+engine just isn't offered
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Name the GUI and the CLI show for this engine
+NATIVE_BASELINE = "Native Baseline (NumPy)"
+
+def available():
+    return np is not None
+
+def numpy_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    NumPy argsort (kind='stable', i.e. radix sort for ints, timsort for names)
+    Same contract as the other <name>_indices sorts, and just as stable:
+    equal keys keep their original order in both directions
+    Cancel/deadline are only checked before the sort, which can't be interrupted
+    """
+    if np is None:
+        raise ValueError("The native baseline needs NumPy (pip install numpy)")
+
+    n = len(keys)
+    if n == 0:
+        return []
+    if (cancel_event is not None and cancel_event.is_set()) or (deadline is not None and deadline <= 0):
+        return None
+
+    # ints become an int64 array, names a fixed-width unicode ('U') array
+    values = np.array(keys)
+
+    if descending:
+        # Sorting the reversed array and reversing the answer puts the largest
+        # keys first while ties still come out in their original order
+        order = n - 1 - np.argsort(values[::-1], kind='stable')[::-1]
+    else:
+        order = np.argsort(values, kind='stable')
+
+    if progress_callback:
+        progress_callback(100)
+    return order.tolist()
@@ -0,0 +1,43 @@
+"""
+Progress Reporting - DAA Prelim Exam
+Lets a sort thread report progress without flooding the Tk event queue
+"""
+
+import time
+
+class ProgressChannel:
+    """
+    Latest progress value shared between a worker thread and the UI
+    The worker only overwrites a float (no Tk calls, no queue to grow);
+    the UI reads it on its own timer, so it redraws at most once per frame
+    no matter how often the sort reports
+    """
+
+    def __init__(self):
+        self.value = 0.0
+
+    def report(self, value):
+        # A single attribute store is atomic under the GIL, so no lock needed
+        self.value = value
+
+    def reset(self):
+        self.value = 0.0
+
+def throttle(callback, min_step=0.5, min_interval=0.05):
+    """
+    Wraps a progress callback so it only fires when the value moved by at least
+    min_step percent or min_interval seconds passed (100% always goes through)
+    Use it for callbacks that are slow themselves, like printing to a terminal
+    """
+    last = {'value': None, 'time': 0.0}
+
+    def throttled(value):
+        now = time.perf_counter()
+        if (value >= 100 or last['value'] is None
+                or value - last['value'] >= min_step
+                or now - last['time'] >= min_interval):
+            last['value'] = value
+            last['time'] = now
+            callback(value)
+
+    return throttled
@@ -0,0 +1,160 @@
+"""
+Virtual Result View - DAA Prelim Exam
+A Treeview that can page through millions of sorted rows: only the rows
+on screen exist as Tk items, the rest stay in the sorted RowView until
+they are scrolled into view
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from dataset_store import ColumnarDataset
+
+class VirtualResultView(tk.Frame):
+    """
+    Shows rows[top:top + visible_rows] and rebuilds just that window when the
+    user scrolls, so memory and redraw time don't depend on len(rows)
+    """
+
+    def __init__(self, parent, visible_rows=15, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.visible_rows = visible_rows
+        self.rows = []
+        self.top = 0
+        self.key = None          # Column the rows are sorted by (for jump-to-key)
+        self.descending = False
+
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=("Row",) + ColumnarDataset.COLUMNS,
+            show="headings",
+            height=visible_rows,
+            selectmode="browse"
+        )
+        self.tree.heading("Row", text="#")
+        self.tree.heading("ID", text="ID")
+        self.tree.heading("FirstName", text="First Name")
+        self.tree.heading("LastName", text="Last Name")
+
+        self.tree.column("Row", width=80, anchor="e")
+        self.tree.column("ID", width=120, anchor="w")
+        self.tree.column("FirstName", width=200, anchor="w")
+        self.tree.column("LastName", width=200, anchor="w")
+
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        # Returning "break" keeps the page canvas from scrolling along with the list
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll_by(int(-1 * (e.delta / 120)) * 3))
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.tree.bind("<Up>", lambda e: self._scroll_by(-1))
+        self.tree.bind("<Down>", lambda e: self._scroll_by(1))
+        self.tree.bind("<Prior>", lambda e: self._scroll_by(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self._scroll_by(self.visible_rows))
+        self.tree.bind("<Home>", lambda e: self.jump_to_row(0))
+        self.tree.bind("<End>", lambda e: self.jump_to_row(len(self.rows) - 1))
+
+        self.on_scroll = None  # Optional callback(first, last, total) after each redraw
+        self._render()
+
+    def set_rows(self, rows, key=None, descending=False):
+        """
+        rows only needs len() and indexing that returns a record dict (e.g. a RowView)
+        key / descending describe the sort, so jump_to_key knows where to look
+        """
+        self.rows = rows
+        self.key = key
+        self.descending = descending
+        self.top = 0
+        self._render()
+
+    def clear(self):
+        self.set_rows([])
+
+    def _max_top(self):
+        return max(len(self.rows) - self.visible_rows, 0)
+
+    def _scroll_to(self, top):
+        self.top = min(max(top, 0), self._max_top())
+        self._render()
+
+    def _scroll_by(self, rows):
+        self._scroll_to(self.top + rows)
+        return "break"
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        # Tk sends ("moveto", fraction) when dragging, ("scroll", n, "units"/"pages") for the arrows
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self.rows)))
+        elif unit == "pages":
+            self._scroll_by(int(amount) * self.visible_rows)
+        else:
+            self._scroll_by(int(amount))
+
+    def _render(self, selected=None):
+        """
+        Replaces the Tk items with the rows in the current window (at most visible_rows)
+        """
+        self.tree.delete(*self.tree.get_children())
+
+        total = len(self.rows)
+        end = min(self.top + self.visible_rows, total)
+        for i in range(self.top, end):
+            record = self.rows[i]
+            self.tree.insert("", "end", iid=str(i), values=(
+                f"{i + 1:,}",
+                record.get('ID', 'N/A'),
+                record.get('FirstName', 'N/A'),
+                record.get('LastName', 'N/A')
+            ), tags=("even" if i % 2 == 0 else "odd",))
+
+        if selected is not None and self.top <= selected < end:
+            self.tree.selection_set(str(selected))
+            self.tree.focus(str(selected))
+
+        if total:
+            self.scrollbar.set(self.top / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+        if self.on_scroll:
+            self.on_scroll(self.top, end, total)
+
+    def jump_to_row(self, row):
+        """
+        Scrolls so that row (0-based) is at the top and selects it
+        """
+        if not len(self.rows):
+            return "break"
+        row = min(max(row, 0), len(self.rows) - 1)
+        self.top = min(row, self._max_top())
+        self._render(selected=row)
+        return "break"
+
+    def jump_to_key(self, value):
+        """
+        Jumps to the first row whose sort key is at or past value (binary
+        search over the sorted rows, so only about log2(n) records are read)
+        Returns the row it jumped to, or None if the rows aren't sorted by a key
+        """
+        if self.key is None or not len(self.rows):
+            return None
+        if self.key in ColumnarDataset.INTEGER_COLUMNS:
+            value = int(value)
+
+        key, rows = self.key, self.rows
+        lo, hi = 0, len(rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = rows[mid][key]
+            before = current > value if self.descending else current < value
+            if before:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        row = min(lo, len(rows) - 1)
+        self.jump_to_row(row)
+        return row
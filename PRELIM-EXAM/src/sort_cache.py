@@ -0,0 +1,100 @@
+"""
+Sort Result Cache - DAA Prelim Exam
+Remembers recent sorted orders so re-running the same sort is instant
+"""
+
+from array import array
+from collections import OrderedDict
+
+import sorting_algorithms
+
+# Default memory budget: 64 MB is about 16 million cached row positions
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+class PermutationCache:
+    """
+    Least-recently-used cache of sorted index permutations
+    Keyed by (dataset version, n, sort spec, algorithm). Only the 4-byte row
+    positions are stored, never copies of the records, and the oldest entries
+    are dropped once the total goes over max_bytes
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> array('I') of row positions, oldest first
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(dataset, n, spec, algorithm):
+        return (dataset.version, n, tuple(spec), algorithm)
+
+    def get(self, dataset, n, spec, algorithm):
+        """
+        Returns the cached order for the first n rows, or None
+        For a stable algorithm a cached order of a bigger prefix works too:
+        keeping only the positions below n gives exactly the stable order of
+        the first n rows, in O(N) instead of a new O(n log n) sort
+        """
+        key = self.make_key(dataset, n, spec, algorithm)
+        order = self.entries.get(key)
+        if order is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return order
+
+        if algorithm not in sorting_algorithms.UNSTABLE_ALGORITHMS:
+            # Smallest cached prefix that covers n rows (least filtering work)
+            version, _, spec_key, _ = key
+            larger = None
+            for (cached_version, size, cached_spec, cached_algorithm), cached in self.entries.items():
+                if (cached_version == version and cached_spec == spec_key
+                        and cached_algorithm == algorithm and size > n
+                        and (larger is None or size < len(larger))):
+                    larger = cached
+            if larger is not None:
+                self.hits += 1
+                order = array('I', [i for i in larger if i < n])
+                self.put(dataset, n, spec, algorithm, order)
+                return order
+
+        self.misses += 1
+        return None
+
+    def covers(self, dataset, n, spec, algorithm):
+        """
+        Whether get() would return an order (without counting it as a hit or miss)
+        """
+        version, _, spec_key, _ = key = self.make_key(dataset, n, spec, algorithm)
+        if key in self.entries:
+            return True
+        if algorithm in sorting_algorithms.UNSTABLE_ALGORITHMS:
+            return False
+        return any(cached_version == version and cached_spec == spec_key
+                   and cached_algorithm == algorithm and size > n
+                   for cached_version, size, cached_spec, cached_algorithm in self.entries)
+
+    def put(self, dataset, n, spec, algorithm, order):
+        if not isinstance(order, array):
+            order = array('I', order)
+        size = order.itemsize * len(order)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+
+        key = self.make_key(dataset, n, spec, algorithm)
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old.itemsize * len(old)
+
+        self.entries[key] = order
+        self.bytes_used += size
+
+        # Evict least recently used entries until we're back under budget
+        while self.bytes_used > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes_used -= evicted.itemsize * len(evicted)
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
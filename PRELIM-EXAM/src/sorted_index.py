@@ -0,0 +1,190 @@
+"""
+Sorted Column Index - DAA Prelim Exam
+Saves the sorted order of each column next to the CSV, so sorting by a
+column later is just reading rows in that order (O(n), no comparisons),
+and value / range / prefix lookups are a binary search over the index
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import sorting_algorithms
+import dataset_store
+from dataset_store import ColumnarDataset
+
+# Index file written next to the CSV (e.g. generated_data.csv.LastName.sortidx)
+INDEX_SUFFIX = ".sortidx"
+
+# Magic bytes + byte order, since the positions are stored in native format
+INDEX_MAGIC = b"DAAIDX1" + (b"L" if sys.byteorder == "little" else b"B")
+
+# Header after the magic: CSV size, mtime_ns, sample hash (same fingerprint as
+# the .colcache), then the row count
+INDEX_HEADER = struct.Struct("<qq16sq")
+
+# Linear-time algorithm used to build each column's index
+BUILD_ALGORITHMS = {"ID": "Radix Sort", "FirstName": "String Radix Sort", "LastName": "String Radix Sort"}
+
+def index_path(csv_path, column):
+    return f"{csv_path}.{column}{INDEX_SUFFIX}"
+
+class SortedIndex:
+    """
+    Row positions of a dataset in ascending order of one column (ties by row)
+    """
+
+    def __init__(self, store, column, positions, mapped=None):
+        self.store = store
+        self.column = column
+        self.positions = positions
+        self._mmap = mapped  # Keeps a memory-mapped index file open while we use it
+
+        # Reads one row's key straight from the columnar store
+        if column in ColumnarDataset.INTEGER_COLUMNS:
+            self.key_of = store.ids.__getitem__
+        else:
+            values = store.values[column]
+            codes = store.codes[column]
+            self.key_of = lambda row: values[codes[row]]
+
+    def __len__(self):
+        return len(self.positions)
+
+    def order(self, n=None, descending=False):
+        """
+        Sorted order of the first n rows, same as a stable sort would give - O(n)
+        """
+        positions = self.positions
+        if n is not None and n < len(positions):
+            positions = [row for row in positions if row < n]
+        if not descending:
+            return positions
+
+        # Largest keys first, but equal keys stay in row order (stable):
+        # walk the groups of equal keys from the back and copy each group as is
+        key_of = self.key_of
+        result = []
+        end = len(positions)
+        while end > 0:
+            start = end - 1
+            key = key_of(positions[start])
+            while start > 0 and key_of(positions[start - 1]) == key:
+                start -= 1
+            result.extend(positions[start:end])
+            end = start
+        return result
+
+    def _lower_bound(self, value):
+        """
+        First place in the index whose key is >= value (binary search)
+        """
+        positions, key_of = self.positions, self.key_of
+        lo, hi = 0, len(positions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_of(positions[mid]) < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _upper_bound(self, value):
+        """
+        First place in the index whose key is > value (binary search)
+        """
+        positions, key_of = self.positions, self.key_of
+        lo, hi = 0, len(positions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if value < key_of(positions[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def lookup(self, value):
+        """
+        Rows whose key equals value - O(log n + matches)
+        """
+        return self.positions[self._lower_bound(value):self._upper_bound(value)]
+
+    def lookup_range(self, low, high):
+        """
+        Rows with low <= key <= high, in key order - O(log n + matches)
+        """
+        return self.positions[self._lower_bound(low):self._upper_bound(high)]
+
+    def lookup_prefix(self, prefix):
+        """
+        Rows whose text key starts with prefix (text columns only)
+        """
+        if self.column in ColumnarDataset.INTEGER_COLUMNS:
+            raise ValueError(f"Prefix lookups need a text column, not {self.column}")
+        # Every string starting with prefix sorts before prefix + the largest code point
+        return self.lookup_range(prefix, prefix + chr(sys.maxunicode))
+
+def build_index(store, column):
+    """
+    Sorts one column of the store and wraps the order in a SortedIndex
+    """
+    algorithm = BUILD_ALGORITHMS[column]
+    order = sorting_algorithms.ALGORITHMS[algorithm](store.column(column))
+    return SortedIndex(store, column, array('I', order))
+
+def write_index(index, path, fingerprint):
+    size, mtime_ns, sample_hash = fingerprint
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(INDEX_MAGIC)
+        file.write(INDEX_HEADER.pack(size, mtime_ns, sample_hash, len(index)))
+        file.write(index.positions.tobytes())
+    os.replace(temp_path, path)
+
+def load_index(store, column, path, fingerprint):
+    """
+    Memory-maps an index file written by write_index
+    Returns None if there's no index or it doesn't match the CSV anymore
+    """
+    try:
+        file = open(path, 'rb')
+    except OSError:
+        return None
+
+    with file:
+        head = file.read(len(INDEX_MAGIC) + INDEX_HEADER.size)
+        if len(head) < len(INDEX_MAGIC) + INDEX_HEADER.size or not head.startswith(INDEX_MAGIC):
+            return None
+        size, mtime_ns, sample_hash, rows = INDEX_HEADER.unpack_from(head, len(INDEX_MAGIC))
+        if (size, mtime_ns, sample_hash) != fingerprint or rows != len(store):
+            return None
+        if os.fstat(file.fileno()).st_size != len(head) + rows * 4:
+            return None
+        if rows == 0:
+            return SortedIndex(store, column, array('I'))
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    positions = memoryview(mapped)[len(head):].cast('I')
+    return SortedIndex(store, column, positions, mapped)
+
+def load_or_build_indexes(store, csv_path, columns=ColumnarDataset.COLUMNS, rebuild=False):
+    """
+    Returns {column: SortedIndex}, loading the saved index files when they are
+    still up to date and building (and saving) the missing or stale ones
+    """
+    fingerprint = dataset_store._fingerprint(csv_path)
+    indexes = {}
+    for column in columns:
+        path = index_path(csv_path, column)
+        index = None if rebuild else load_index(store, column, path, fingerprint)
+        if index is None:
+            index = build_index(store, column)
+            try:
+                write_index(index, path, fingerprint)
+            except OSError:
+                # Read-only folder etc. - the index still works from memory
+                pass
+        indexes[column] = index
+    return indexes
@@ -1,212 +1,1739 @@
 """
 Sorting Algorithms - DAA Prelim Exam
-Bubble Sort, Insertion Sort, Merge Sort
+Bubble Sort, Insertion Sort, Merge Sort, Hybrid Merge Sort (insertion sort
+below a tuned cutoff), Bottom-Up Merge Sort,
+Adaptive Merge Sort (TimSort-style natural runs), Parallel Merge Sort,
+Counting Sort and LSD Radix Sort (integer keys only),
+String Radix Sort (MSD radix sort for text keys),
+Introsort (in-place quicksort with heapsort fallback),
+Heap Top-K and Quickselect Top-K (first k records only)
+
+Every sort works in two layers:
+  * <name>_indices(keys, ...) sorts a plain list of key values and returns
+    the index permutation (which original position goes where)
+  * <name>(data, key, ...) pulls the key column out of the records once,
+    sorts the indices, then builds the sorted list of records at the end
 """
 
+import heapq
+import itertools
 import math
+import multiprocessing
+import operator
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import instrumentation
+import native_backend
+
+# Most progress reports a sort sends over a whole run, so reporting stays cheap
+# however big n gets (the GUI only redraws a few dozen times a second anyway)
+PROGRESS_STEPS = 200
+
+# Roughly how many elements a sort handles between cancellation checks, so the
+# hot loops never pay an Event.is_set() call per comparison
+CANCEL_CHECK_EVERY = 4096
+
+def cancel_checker(cancel_event=None, deadline=None):
+    """
+    Returns a function that says whether a sort should stop:
+    the STOP button was pressed (cancel_event) or deadline seconds have passed
+    A timed-out sort returns None, same as a cancelled one
+    """
+    if deadline is None:
+        return cancel_event.is_set if cancel_event else (lambda: False)
+
+    stop_at = time.perf_counter() + deadline
+    if cancel_event is None:
+        return lambda: time.perf_counter() >= stop_at
+    return lambda: cancel_event.is_set() or time.perf_counter() >= stop_at
+
+class _CheckerEvent:
+    """
+    Makes a cancel_checker look like a cancel_event, so a sort that hands part
+    of its work to another sort passes on the SAME deadline instead of a fresh one
+    """
+
+    def __init__(self, is_cancelled):
+        self.is_set = is_cancelled
+
+def extract_keys(data, key):
+    """
+    Decorate step - reads the sort column out of every record once
+    so the sorts compare plain values instead of calling .get() per comparison
+    """
+    # Columnar datasets (dataset_store) hand over the whole column in one go
+    if hasattr(data, 'column'):
+        return data.column(key)
+    return [record.get(key) for record in data]
 
-def bubble_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+def apply_order(data, order):
+    """
+    Undecorate step - builds the sorted list of records from an index permutation
+    """
+    # Columnar datasets return a lazy view instead of copying records
+    if hasattr(data, 'take'):
+        return data.take(order)
+    return [data[i] for i in order]
+
+def _sort_records(index_sort, data, key, descending, progress_callback, cancel_event, deadline):
+    """
+    Runs an index sort over the records: extract keys, sort indices, materialize
+    """
+    keys = extract_keys(data, key)
+    order = index_sort(keys, descending, progress_callback, cancel_event, deadline)
+    if order is None:
+        return None
+    return apply_order(data, order)
+
+def bubble_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
     """
     Bubble Sort - compares neighbors and swaps them
-    O(n²) time, O(1) space
+    O(n²) time, O(n) space for the index permutation
     """
-    # Make a copy so we don't mess up the original list
-    data = data[:]
-    n = len(data)
-    
-    # Setup cancel checker (for the STOP button)
-    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
-    
+    # Work on a copy of the keys, the indices get swapped right alongside them
+    keys = instrumentation.copy_keys(keys)
+    n = len(keys)
+    order = instrumentation.index_list(keys)
+
+    # Setup cancel checker (for the STOP button and the time limit)
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
     # Figure out how many comparisons we'll do total
     total_comparisons = n * (n - 1) // 2
     comparisons_done = 0
-    
+    report_every = max(n // PROGRESS_STEPS, 1)
+
     # Go through the list multiple times
     for i in range(n):
-        # Check if user pressed STOP
+        # Check if user pressed STOP (once per pass, a pass is at most n comparisons)
         if is_cancelled():
             return None
-            
+
         swapped = False
         comparisons_in_pass = n - i - 1
-        
+
         # Compare each pair of neighbors
         for j in range(0, comparisons_in_pass):
-            val1 = data[j].get(key)
-            val2 = data[j+1].get(key)
-            
+            val1 = keys[j]
+            val2 = keys[j+1]
+
             # Figure out if we need to swap these two
-            should_swap = False
             if descending:
-                if val1 < val2:
-                    should_swap = True
+                should_swap = val1 < val2
             else:
-                if val1 > val2:
-                    should_swap = True
-                    
+                should_swap = val1 > val2
+
             if should_swap:
-                # Swap the two items
-                data[j], data[j+1] = data[j+1], data[j]
+                # Swap the two keys and their indices
+                keys[j], keys[j+1] = val2, val1
+                order[j], order[j+1] = order[j+1], order[j]
                 swapped = True
-            
-            # Every 1000 comparisons, check if user wants to stop
-            if j % 1000 == 0 and is_cancelled():
-                return None
-        
-        # Update the progress bar
+
+        # Update the progress bar every few passes
         comparisons_done += comparisons_in_pass
-        if progress_callback:
+        if progress_callback and i % report_every == 0:
             p = (comparisons_done / total_comparisons) * 100
             progress_callback(min(p, 99.9))
-        
+
         # If nothing got swapped this round, we're done early!
         if not swapped:
             break
-    
+
     # Set progress to 100%
     if progress_callback:
         progress_callback(100)
-    return data
+    return order
 
-def insertion_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+def bubble_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Bubble Sort over records, sorted by the given column
+    O(n²) time, O(n) space
+    """
+    return _sort_records(bubble_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+def insertion_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
     """
     Insertion Sort - picks elements and puts them in the right spot
-    O(n²) time, O(1) space
+    O(n²) time, O(n) space for the index permutation
     """
-    # Make a copy so we don't mess up the original list
-    data = data[:]
-    n = len(data)
-    
+    # Work on a copy of the keys, the indices move right alongside them
+    keys = instrumentation.copy_keys(keys)
+    n = len(keys)
+    order = instrumentation.index_list(keys)
+
     # Setup cancel checker
-    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
-    
+    is_cancelled = cancel_checker(cancel_event, deadline)
+    report_every = max(n // PROGRESS_STEPS, 1)
+
+    # Count the items shifted so we only check for STOP every CANCEL_CHECK_EVERY of them
+    work_done = 0
+    next_check = 0
+
     # Start from second item (first item is already "sorted")
     for i in range(1, n):
         # Check if user pressed STOP
-        if is_cancelled():
-            return None
-            
+        if work_done >= next_check:
+            if is_cancelled():
+                return None
+            next_check = work_done + CANCEL_CHECK_EVERY
+
         # Grab the current item we're trying to place
-        current_record = data[i]
-        current_val = current_record.get(key)
+        current_val = keys[i]
+        current_index = order[i]
         j = i - 1
-        
+
         # Move backwards through the sorted part
         while j >= 0:
-            compare_val = data[j].get(key)
-            should_move = False
-            
+            compare_val = keys[j]
+
             # Check if we need to keep moving
             if descending:
-                if compare_val < current_val:
-                    should_move = True
+                should_move = compare_val < current_val
             else:
-                if compare_val > current_val:
-                    should_move = True
-            
+                should_move = compare_val > current_val
+
             if should_move:
                 # Scoot this item to the right to make room
-                data[j + 1] = data[j]
+                keys[j + 1] = compare_val
+                order[j + 1] = order[j]
                 j -= 1
             else:
                 # Found the right spot!
                 break
-        
+
         # Drop the current item into its correct position
-        data[j + 1] = current_record
-        
-        # Update progress bar every 10 items
-        if progress_callback and i % 10 == 0:
+        keys[j + 1] = current_val
+        order[j + 1] = current_index
+        work_done += i - j
+
+        # Update progress bar every few items
+        if progress_callback and i % report_every == 0:
             p = (i / n) ** 2 * 100
             progress_callback(p)
-    
+
     # Set progress to 100%
     if progress_callback:
         progress_callback(100)
-    return data
+    return order
+
+def insertion_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Insertion Sort over records, sorted by the given column
+    O(n²) time, O(n) space
+    """
+    return _sort_records(insertion_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+# Hybrid Merge Sort stops splitting below this many items and binary-insertion
+# sorts the piece instead (tune_hybrid_cutoff measures the best value per key type)
+HYBRID_MERGE_CUTOFF = 24
+
+# Cutoffs measured by tune_hybrid_cutoff on this machine, by key type (int, str, ...)
+# The saved ones (data/calibration.json) are loaded the first time Hybrid Merge Sort runs
+HYBRID_MERGE_CUTOFFS = {}
+_saved_cutoffs_loaded = False
+
+def _load_saved_cutoffs():
+    global _saved_cutoffs_loaded
+    _saved_cutoffs_loaded = True
 
-def merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+    # Imported here because calibration imports this module
+    import calibration
+    key_types = {key_type.__name__: key_type for key_type in (int, float, str)}
+    for name, cutoff in calibration.load_hybrid_cutoffs().items():
+        if name in key_types:
+            # A cutoff tuned in this session wins over the saved one
+            HYBRID_MERGE_CUTOFFS.setdefault(key_types[name], cutoff)
+
+def merge_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None, cutoff=1):
     """
     Merge Sort - splits array in half, sorts each half, then combines
     O(n log n) time, O(n) space
+    Pieces of cutoff items or fewer are insertion sorted instead of split further
     """
     # Base case: list with 0 or 1 item is already sorted
-    if len(data) <= 1:
-        return data
-    
+    if len(keys) <= 1:
+        return list(range(len(keys)))
+
     # Setup cancel checker
-    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
-    
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
     # Calculate total work for progress tracking
-    total_elements = len(data)
+    total_elements = len(keys)
     total_work = total_elements * math.log2(total_elements) if total_elements > 1 else 1
     state = [0]  # Using a list so the inner function can modify it
-    
+
+    # Only the bigger merges report progress (the tiny ones are most of the calls)
+    report_min = max(total_elements // PROGRESS_STEPS, 2)
+    lt = operator.gt if descending else operator.lt
+
     def merge_recursive(arr):
-        # Check if user pressed STOP
-        if is_cancelled():
+        # Check if user pressed STOP (only on big pieces, the small ones are over in no time)
+        if len(arr) >= CANCEL_CHECK_EVERY and is_cancelled():
             return None
-            
+
         # Base case: tiny lists don't need sorting
         if len(arr) <= 1:
             return arr
-            
+
+        # Hybrid mode: small pieces are cheaper to insertion sort than to keep splitting
+        if len(arr) <= cutoff:
+            _binary_insertion([keys[i] for i in arr], arr, 0, len(arr), 1, lt)
+            state[0] += len(arr) * math.log2(len(arr))
+            return arr
+
         # Split the list in half
         mid = len(arr) // 2
         left_half = merge_recursive(arr[:mid])
         if left_half is None:
             return None
-            
+
         right_half = merge_recursive(arr[mid:])
         if right_half is None:
             return None
-        
-        # Now merge the two sorted halves back together
-        merged = []
+
+        # Now merge the two sorted halves back together (arr[:0] is an empty
+        # list of the same kind, so an instrumented run counts these moves too)
+        merged = arr[:0]
         i = j = 0
-        
+        len_left = len(left_half)
+        len_right = len(right_half)
+        next_check = CANCEL_CHECK_EVERY
+
         # Pick the smaller item from left or right until one runs out
-        while i < len(left_half) and j < len(right_half):
-            if is_cancelled():
-                return None
-                
-            val1 = left_half[i].get(key)
-            val2 = right_half[j].get(key)
-            
-            # Decide which side to pick from
-            pick_left = False
+        while i < len_left and j < len_right:
+            # The top merges are O(n) each, so check for STOP inside them too
+            if i + j >= next_check:
+                if is_cancelled():
+                    return None
+                next_check += CANCEL_CHECK_EVERY
+
+            val1 = keys[left_half[i]]
+            val2 = keys[right_half[j]]
+
+            # Decide which side to pick from (ties go left to keep it stable)
             if descending:
-                if val1 >= val2:
-                    pick_left = True
+                pick_left = val1 >= val2
             else:
-                if val1 <= val2:
-                    pick_left = True
-            
+                pick_left = val1 <= val2
+
             if pick_left:
                 merged.append(left_half[i])
                 i += 1
             else:
                 merged.append(right_half[j])
                 j += 1
-        
+
         # Add any leftover items
         merged.extend(left_half[i:])
         merged.extend(right_half[j:])
-        
+
         # Update progress bar
         state[0] += len(arr)
-        if progress_callback:
+        if progress_callback and len(arr) >= report_min:
             p = (state[0] / total_work) * 100
             progress_callback(min(p, 99.9))
-        
+
         return merged
-    
-    # Start the recursive sorting
-    result = merge_recursive(data[:])
+
+    # Start the recursive sorting on the index list
+    result = merge_recursive(instrumentation.index_list(keys))
     if result is None:
         return None
-        
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return result
+
+def merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Merge Sort over records, sorted by the given column
+    O(n log n) time, O(n) space
+    """
+    # Base case: list with 0 or 1 item is already sorted
+    if len(data) <= 1:
+        return data
+    return _sort_records(merge_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+def hybrid_merge_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Hybrid Merge Sort - merge sort that binary-insertion sorts pieces below the cutoff
+    O(n log n) time, O(n) space
+    """
+    if not _saved_cutoffs_loaded:
+        _load_saved_cutoffs()
+    cutoff = HYBRID_MERGE_CUTOFF
+    if len(keys):
+        cutoff = HYBRID_MERGE_CUTOFFS.get(instrumentation.key_type(keys[0]), cutoff)
+    return merge_sort_indices(keys, descending, progress_callback, cancel_event, deadline, cutoff=cutoff)
+
+def hybrid_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Hybrid Merge Sort over records, sorted by the given column
+    """
+    return _sort_records(hybrid_merge_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+def tune_hybrid_cutoff(keys, candidates=(1, 8, 16, 24, 32, 48, 64), sample_size=20000, repeat=5, save=True):
+    """
+    Times merge sort on a sample of keys with each candidate cutoff and keeps
+    the fastest one for this key type (used by Hybrid Merge Sort from then on)
+    save=True also saves it for this machine, so later runs and the GUI use it too
+    Returns (best cutoff, {cutoff: best time in seconds}); cutoff 1 is plain merge sort
+    """
+    sample = list(keys[:sample_size])
+    if not sample:
+        return HYBRID_MERGE_CUTOFF, {}
+
+    # One untimed run first so the first candidate doesn't pay for warming up
+    merge_sort_indices(sample)
+
+    timings = {}
+    for cutoff in candidates:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            merge_sort_indices(sample, cutoff=cutoff)
+            duration = time.perf_counter() - start
+            if best is None or duration < best:
+                best = duration
+        timings[cutoff] = best
+
+    best_cutoff = min(timings, key=timings.get)
+    HYBRID_MERGE_CUTOFFS[type(sample[0])] = best_cutoff
+    if save:
+        import calibration
+        calibration.save_hybrid_cutoffs({type(sample[0]).__name__: best_cutoff})
+    return best_cutoff, timings
+
+def bottom_up_merge_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Bottom-Up Merge Sort - merges runs of width 1, 2, 4, ... without recursion
+    Ping-pongs between the index list and ONE auxiliary list of length n
+    O(n log n) time, O(n) space
+    """
+    n = len(keys)
+    src = instrumentation.index_list(keys)
+    if n <= 1:
+        return src
+
+    # The only extra buffer we ever allocate, every pass merges src -> dst
+    dst = src[:]
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Each pass doubles the run width, so there are ceil(log2 n) passes
+    total_passes = math.ceil(math.log2(n))
+    passes_done = 0
+
+    width = 1
+    while width < n:
+        # Check if user pressed STOP
+        if is_cancelled():
+            return None
+
+        next_check = CANCEL_CHECK_EVERY
+        for lo in range(0, n, 2 * width):
+            # Every CANCEL_CHECK_EVERY elements, check if user wants to stop
+            if lo >= next_check:
+                if is_cancelled():
+                    return None
+                next_check = lo + CANCEL_CHECK_EVERY
+
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+
+            # Pick the smaller item from left or right run until one runs out
+            while i < mid and j < hi:
+                left = src[i]
+                right = src[j]
+
+                # Ties go left to keep it stable
+                if descending:
+                    pick_left = keys[left] >= keys[right]
+                else:
+                    pick_left = keys[left] <= keys[right]
+
+                if pick_left:
+                    dst[k] = left
+                    i += 1
+                else:
+                    dst[k] = right
+                    j += 1
+                k += 1
+
+            # Copy whatever is left of the run that didn't run out
+            if i < mid:
+                dst[k:hi] = src[i:mid]
+            elif j < hi:
+                dst[k:hi] = src[j:hi]
+
+        # The merged runs are now in dst, so swap the roles of the two buffers
+        src, dst = dst, src
+        width *= 2
+
+        # Update progress bar once per pass
+        passes_done += 1
+        if progress_callback:
+            progress_callback(min(passes_done / total_passes * 100, 99.9))
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return src
+
+def bottom_up_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Bottom-Up Merge Sort over records, sorted by the given column
+    O(n log n) time, O(n) space
+    """
+    return _sort_records(bottom_up_merge_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+# Adaptive merge sort tuning (same values CPython's own listsort uses)
+MIN_MERGE = 64
+MIN_GALLOP = 7
+
+def _compute_min_run(n):
+    """
+    Picks a run length between 32 and 64 so n / min_run is close to a power of 2
+    """
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _count_run(keys, order, lo, hi, lt):
+    """
+    Finds the natural run starting at lo and returns its length
+    A strictly descending run is reversed in place so every run ends up ascending
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if lt(keys[run_hi], keys[lo]):
+        # Strictly descending (strict so reversing it can't break stability)
+        run_hi += 1
+        while run_hi < hi and lt(keys[run_hi], keys[run_hi - 1]):
+            run_hi += 1
+        keys[lo:run_hi] = keys[lo:run_hi][::-1]
+        order[lo:run_hi] = order[lo:run_hi][::-1]
+    else:
+        # Non-descending
+        run_hi += 1
+        while run_hi < hi and not lt(keys[run_hi], keys[run_hi - 1]):
+            run_hi += 1
+
+    return run_hi - lo
+
+def _binary_insertion(keys, order, lo, hi, start, lt):
+    """
+    Extends the sorted slice [lo, start) to [lo, hi) one item at a time,
+    finding each spot with a binary search instead of walking backwards
+    """
+    for i in range(start, hi):
+        pivot = keys[i]
+        pivot_index = order[i]
+
+        # Find the first spot where pivot < keys[spot] (after equal keys, so it stays stable)
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if lt(pivot, keys[mid]):
+                right = mid
+            else:
+                left = mid + 1
+
+        # Shift everything after that spot one place to the right
+        keys[left + 1:i + 1] = keys[left:i]
+        order[left + 1:i + 1] = order[left:i]
+        keys[left] = pivot
+        order[left] = pivot_index
+
+def _gallop_left(key, keys, start, end, lt):
+    """
+    First position in sorted keys[start:end] whose value is >= key
+    Searches 1, 3, 7, 15, ... steps ahead first, then binary searches the last gap
+    """
+    length = end - start
+    if length == 0 or not lt(keys[start], key):
+        return start
+
+    last_ofs, ofs = 0, 1
+    while ofs < length and lt(keys[start + ofs], key):
+        last_ofs = ofs
+        ofs = ofs * 2 + 1
+    if ofs > length:
+        ofs = length
+
+    lo, hi = start + last_ofs + 1, start + ofs
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if lt(keys[mid], key):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _gallop_right(key, keys, start, end, lt):
+    """
+    First position in sorted keys[start:end] whose value is > key
+    Same search as _gallop_left, but equal values count as "before" the key
+    """
+    length = end - start
+    if length == 0 or lt(key, keys[start]):
+        return start
+
+    last_ofs, ofs = 0, 1
+    while ofs < length and not lt(key, keys[start + ofs]):
+        last_ofs = ofs
+        ofs = ofs * 2 + 1
+    if ofs > length:
+        ofs = length
+
+    lo, hi = start + last_ofs + 1, start + ofs
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if lt(key, keys[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+def _merge_runs(keys, order, base1, len1, base2, len2, lt, min_gallop, is_cancelled=None):
+    """
+    Merges the adjacent sorted runs [base1, base1+len1) and [base2, base2+len2)
+    Returns the updated min_gallop so the next merge remembers how well galloping paid off,
+    or None if is_cancelled() said to stop partway (keys/order are then left half merged)
+    """
+    # Items at the start of run 1 that are <= everything in run 2 are already in place
+    start = _gallop_right(keys[base2], keys, base1, base1 + len1, lt)
+    len1 -= start - base1
+    base1 = start
+    if len1 == 0:
+        return min_gallop
+
+    # Items at the end of run 2 that are >= everything in run 1 are already in place
+    len2 = _gallop_left(keys[base1 + len1 - 1], keys, base2, base2 + len2, lt) - base2
+    if len2 == 0:
+        return min_gallop
+
+    # Copy run 1 out of the way, then merge it with run 2 from left to right
+    temp_keys = keys[base1:base1 + len1]
+    temp_order = order[base1:base1 + len1]
+    i = 0
+    j = base2
+    end2 = base2 + len2
+    dest = base1
+    done = False
+
+    # Check for STOP every CANCEL_CHECK_EVERY items placed (never, without a checker)
+    next_check = dest + CANCEL_CHECK_EVERY if is_cancelled else end2 + 1
+
+    while not done:
+        count1 = count2 = 0  # How many times in a row each run has won
+
+        # One item at a time until one side keeps winning
+        while True:
+            if dest >= next_check:
+                if is_cancelled():
+                    return None
+                next_check = dest + CANCEL_CHECK_EVERY
+
+            if lt(keys[j], temp_keys[i]):
+                keys[dest] = keys[j]
+                order[dest] = order[j]
+                dest += 1
+                j += 1
+                count2 += 1
+                count1 = 0
+                if j == end2:
+                    done = True
+                    break
+            else:
+                keys[dest] = temp_keys[i]
+                order[dest] = temp_order[i]
+                dest += 1
+                i += 1
+                count1 += 1
+                count2 = 0
+                if i == len1:
+                    done = True
+                    break
+            if count1 >= min_gallop or count2 >= min_gallop:
+                break
+
+        # Galloping: copy whole blocks at once while one side keeps winning
+        while not done:
+            if dest >= next_check:
+                if is_cancelled():
+                    return None
+                next_check = dest + CANCEL_CHECK_EVERY
+
+            # How many run 1 items come before the next run 2 item
+            count1 = _gallop_right(keys[j], temp_keys, i, len1, lt) - i
+            if count1:
+                keys[dest:dest + count1] = temp_keys[i:i + count1]
+                order[dest:dest + count1] = temp_order[i:i + count1]
+                dest += count1
+                i += count1
+                if i == len1:
+                    done = True
+                    break
+
+            keys[dest] = keys[j]
+            order[dest] = order[j]
+            dest += 1
+            j += 1
+            if j == end2:
+                done = True
+                break
+
+            # How many run 2 items come before the next run 1 item
+            count2 = _gallop_left(temp_keys[i], keys, j, end2, lt) - j
+            if count2:
+                keys[dest:dest + count2] = keys[j:j + count2]
+                order[dest:dest + count2] = order[j:j + count2]
+                dest += count2
+                j += count2
+                if j == end2:
+                    done = True
+                    break
+
+            keys[dest] = temp_keys[i]
+            order[dest] = temp_order[i]
+            dest += 1
+            i += 1
+            if i == len1:
+                done = True
+                break
+
+            # Galloping is paying off, so make it easier to get back into
+            min_gallop -= 1
+            if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                break
+
+        if not done:
+            # Galloping stopped paying off, make it harder to get back into
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+    # Whatever is left of run 1 goes at the end (leftovers of run 2 are already in place)
+    if i < len1:
+        keys[dest:dest + len1 - i] = temp_keys[i:]
+        order[dest:dest + len1 - i] = temp_order[i:]
+
+    return max(min_gallop, 1)
+
+def adaptive_merge_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Adaptive Merge Sort - TimSort-style natural merge sort
+    Finds the runs that are already sorted (reversing descending ones), extends
+    short runs with binary insertion, then merges runs with galloping
+    O(n) time on presorted or reverse-sorted input, O(n log n) worst case, O(n) space
+    """
+    # Work on a copy of the keys, the indices move right alongside them
+    keys = instrumentation.copy_keys(keys)
+    n = len(keys)
+    order = instrumentation.index_list(keys)
+    if n <= 1:
+        return order
+
+    # Descending is just "ascending with the comparison flipped", which keeps it stable
+    lt = operator.gt if descending else operator.lt
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Progress: one unit per item placed in a run plus one per item merged
+    total_work = n + n * max(math.log2(n / MIN_MERGE), 1)
+    work_done = 0
+    report_step = total_work / PROGRESS_STEPS
+    next_report = report_step
+
+    min_run = _compute_min_run(n)
+    min_gallop = MIN_GALLOP
+    runs = []  # Stack of [base, length] for the runs that still need merging
+
+    def merge_at(idx, min_gallop):
+        base1, len1 = runs[idx]
+        base2, len2 = runs[idx + 1]
+        runs[idx] = [base1, len1 + len2]
+        del runs[idx + 1]
+        return _merge_runs(keys, order, base1, len1, base2, len2, lt, min_gallop, is_cancelled), len1 + len2
+
+    next_check = 0
+    lo = 0
+    while lo < n:
+        # Check if user pressed STOP every CANCEL_CHECK_EVERY items of work
+        if work_done >= next_check:
+            if is_cancelled():
+                return None
+            next_check = work_done + CANCEL_CHECK_EVERY
+
+        # Find the next natural run, topping it up to min_run with binary insertion
+        run_len = _count_run(keys, order, lo, n, lt)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion(keys, order, lo, lo + forced, lo + run_len, lt)
+            run_len = forced
+
+        runs.append([lo, run_len])
+        lo += run_len
+        work_done += run_len
+
+        # Keep the run lengths on the stack shrinking fast enough that merges stay balanced
+        while len(runs) > 1:
+            idx = len(runs) - 2
+            if (idx > 0 and runs[idx - 1][1] <= runs[idx][1] + runs[idx + 1][1]) or \
+               (idx > 1 and runs[idx - 2][1] <= runs[idx - 1][1] + runs[idx][1]):
+                if runs[idx - 1][1] < runs[idx + 1][1]:
+                    idx -= 1
+            elif runs[idx][1] > runs[idx + 1][1]:
+                break
+            min_gallop, merged = merge_at(idx, min_gallop)
+            if min_gallop is None:
+                return None
+            work_done += merged
+
+        # Update progress bar once enough work has piled up
+        if progress_callback and work_done >= next_report:
+            progress_callback(min(work_done / total_work * 100, 99.9))
+            next_report = work_done + report_step
+
+    # Merge whatever runs are left on the stack
+    while len(runs) > 1:
+        if is_cancelled():
+            return None
+
+        idx = len(runs) - 2
+        if idx > 0 and runs[idx - 1][1] < runs[idx + 1][1]:
+            idx -= 1
+        min_gallop, merged = merge_at(idx, min_gallop)
+        if min_gallop is None:
+            return None
+        work_done += merged
+
+        if progress_callback:
+            progress_callback(min(work_done / total_work * 100, 99.9))
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return order
+
+def adaptive_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Adaptive Merge Sort over records, sorted by the given column
+    O(n) to O(n log n) time, O(n) space
+    """
+    return _sort_records(adaptive_merge_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+# Below this many items, starting worker processes costs more than it saves
+PARALLEL_MIN_ITEMS = 20000
+
+def _sort_chunk(chunk_keys, descending):
+    """
+    Worker process job: sorts one chunk and returns its local index permutation
+    """
+    return bottom_up_merge_sort_indices(chunk_keys, descending)
+
+def _stop_workers(executor):
+    """
+    Shuts the pool down without waiting, killing workers that are still mid-chunk
+    so a cancelled sort doesn't keep every core busy
+    """
+    # The pool only cancels queued jobs by itself, running ones would finish first
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def parallel_merge_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None, workers=None):
+    """
+    Parallel Merge Sort - splits the keys into one chunk per CPU core,
+    sorts the chunks in separate processes (no GIL in the way), then
+    k-way merges the sorted chunks with a heap in this process
+    O(n log n) time spread over the workers, O(n) space
+    """
+    n = len(keys)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Not worth the process startup for small inputs
+    if workers <= 1 or n < PARALLEL_MIN_ITEMS:
+        return bottom_up_merge_sort_indices(keys, descending, progress_callback, cancel_event, deadline)
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Split into (nearly) equal chunks, remembering where each one starts
+    chunk_size = math.ceil(n / workers)
+    starts = list(range(0, n, chunk_size))
+    sorted_chunks = [None] * len(starts)
+
+    counter = instrumentation.counter_of(keys)
+    if counter is not None:
+        # Instrumented run: the counters can't follow the keys into other
+        # processes, so sort the same chunks one after another right here
+        for c, start in enumerate(starts):
+            if is_cancelled():
+                return None
+            local = _sort_chunk(keys[start:start + chunk_size], descending)
+            sorted_chunks[c] = [(keys[start + i], start + i) for i in local]
+        order = _merge_chunks(sorted_chunks, n, descending, progress_callback, is_cancelled)
+        if order is not None:
+            counter.moves += n  # The k-way merge wrote every index once
+        return order
+
+    # "spawn" starts fresh interpreters: forking a process that has other threads
+    # running (the GUI calls this from its sort thread) can deadlock on their locks
+    executor = ProcessPoolExecutor(max_workers=len(starts), mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pending = {
+            executor.submit(_sort_chunk, keys[start:start + chunk_size], descending): c
+            for c, start in enumerate(starts)
+        }
+
+        # Chunk sorts are the first half of the progress bar
+        while pending:
+            done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+
+            # Check if user pressed STOP
+            if is_cancelled():
+                return None
+
+            for future in done:
+                c = pending.pop(future)
+                start = starts[c]
+                # Turn the chunk's local positions back into positions in keys
+                sorted_chunks[c] = [(keys[start + i], start + i) for i in future.result()]
+
+            if progress_callback:
+                progress_callback((len(starts) - len(pending)) / len(starts) * 50)
+    except BrokenProcessPool:
+        # The workers couldn't start (e.g. the main script can't be re-imported): sort right here
+        return bottom_up_merge_sort_indices(keys, descending, progress_callback, cancel_event, deadline)
+    finally:
+        _stop_workers(executor)
+
+    return _merge_chunks(sorted_chunks, n, descending, progress_callback, is_cancelled)
+
+def _merge_chunks(sorted_chunks, n, descending, progress_callback, is_cancelled):
+    """
+    k-way merge of the sorted (key, index) chunks: the heap holds the front item
+    of every chunk. Ties go to the earlier chunk, and chunks are in original
+    order, so the result stays stable
+    """
+    order = [0] * n
+    merged = heapq.merge(*sorted_chunks, key=operator.itemgetter(0), reverse=descending)
+    for pos, (_, index) in enumerate(merged):
+        order[pos] = index
+
+        # Every CANCEL_CHECK_EVERY items, check for STOP and update the progress bar
+        if pos % CANCEL_CHECK_EVERY == 0:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(min(50 + pos / n * 50, 99.9))
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return order
+
+def parallel_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None, workers=None):
+    """
+    Parallel Merge Sort over records, sorted by the given column
+    workers defaults to the number of CPU cores
+    """
+    keys = extract_keys(data, key)
+    order = parallel_merge_sort_indices(keys, descending, progress_callback, cancel_event, deadline, workers)
+    if order is None:
+        return None
+    return apply_order(data, order)
+
+# Counting sort allocates one counter per possible value, so cap the range it accepts
+COUNTING_SORT_MAX_RANGE = 1 << 20
+
+# Radix sort digit size: 12 bits = 4096 buckets, so 7-digit IDs take 2 passes
+RADIX_BITS = 12
+
+def _integer_range(keys, algorithm_name):
+    """
+    Returns (min, max) of the keys, or raises if they aren't all integers
+    """
+    for k in keys:
+        if type(k) is not int:
+            raise ValueError(f"{algorithm_name} only works on integer columns (got {type(k).__name__})")
+    if not keys:
+        return 0, 0
+    return min(keys), max(keys)
+
+def counting_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Counting Sort - counts how many times each value appears, then places
+    every item straight into its final slot (stable)
+    O(n + k) time, O(n + k) space, k = max - min + 1
+    """
+    n = len(keys)
+    low, high = _integer_range(keys, "Counting Sort")
+    size = high - low + 1
+    if size > COUNTING_SORT_MAX_RANGE:
+        raise ValueError(
+            f"Counting Sort needs {size:,} counters for this column "
+            f"(limit is {COUNTING_SORT_MAX_RANGE:,}), use Radix Sort instead"
+        )
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Pass 1: count each value
+    counts = [0] * size
+    for k in keys:
+        counts[k - low] += 1
+
+    if is_cancelled():
+        return None
+    if progress_callback:
+        progress_callback(50)
+
+    # Turn counts into starting slots (walk the values backwards for descending)
+    slot = 0
+    values = range(size - 1, -1, -1) if descending else range(size)
+    for v in values:
+        c = counts[v]
+        counts[v] = slot
+        slot += c
+
+    # Pass 2: drop every index into its slot, in original order so ties stay stable
+    order = [0] * n
+    for i, k in enumerate(keys):
+        v = k - low
+        order[counts[v]] = i
+        counts[v] += 1
+
+    # Instrumented run: every index was written once
+    counter = instrumentation.counter_of(keys)
+    if counter is not None:
+        counter.moves += n
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return order
+
+def radix_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    LSD Radix Sort - buckets the items by their lowest RADIX_BITS bits, then the
+    next RADIX_BITS, and so on; each pass is stable, so the last pass leaves
+    everything in order
+    O(d * (n + b)) time, O(n + b) space, d = digit passes, b = 2^RADIX_BITS buckets
+    """
+    n = len(keys)
+    low, high = _integer_range(keys, "Radix Sort")
+    order = instrumentation.index_list(keys)
+    if n <= 1:
+        return order
+
+    # A small value range sorts in one counting pass
+    if high - low < n:
+        return counting_sort_indices(keys, descending, progress_callback, cancel_event, deadline)
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Shift everything to start at 0 so negative numbers work too
+    shifted = [k - low for k in keys]
+    total_passes = max(math.ceil((high - low).bit_length() / RADIX_BITS), 1)
+    mask = (1 << RADIX_BITS) - 1
+    counter = instrumentation.counter_of(keys)
+
+    for p in range(total_passes):
+        # Check if user pressed STOP
+        if is_cancelled():
+            return None
+
+        shift = p * RADIX_BITS
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for i in order:
+            buckets[(shifted[i] >> shift) & mask].append(i)
+
+        # Collect the buckets back up (highest digit first for descending)
+        if descending:
+            buckets.reverse()
+        order = list(itertools.chain.from_iterable(buckets))
+
+        # Instrumented run: each pass reads every (shifted) key and moves every index once
+        if counter is not None:
+            counter.key_lookups += n
+            counter.moves += n
+
+        # Update progress bar once per pass
+        if progress_callback:
+            progress_callback(min((p + 1) / total_passes * 100, 99.9))
+
     # Set progress to 100%
     if progress_callback:
         progress_callback(100)
+    return order
+
+def counting_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Counting Sort over records, sorted by an integer column
+    O(n + k) time, O(n + k) space
+    """
+    return _sort_records(counting_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+def radix_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    LSD Radix Sort over records, sorted by an integer column
+    O(d * (n + b)) time, O(n + b) space
+    """
+    return _sort_records(radix_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+# Buckets this small are finished with insertion sort instead of more radix passes
+STRING_RADIX_CUTOFF = 16
+
+def _msd_radix_order(strings, progress_callback=None, cancel_event=None):
+    """
+    MSD Radix Sort over a list of DISTINCT strings, returns their ascending order
+    Buckets by the character at position d, then sorts each bucket on d + 1,
+    so a shared prefix is only ever looked at once per bucket
+    """
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event)
+
+    result = []
+    # Stack of (positions into strings, depth); popped last-in first-out, so
+    # buckets are pushed in reverse to come back off in ascending order
+    stack = [(list(range(len(strings))), 0)]
+    checks = 0
+
+    while stack:
+        items, d = stack.pop()
+
+        # Every 1024 buckets, check if user wants to stop
+        checks += 1
+        if checks % 1024 == 0 and is_cancelled():
+            return None
+
+        if len(items) <= STRING_RADIX_CUTOFF:
+            # Small bucket: plain insertion sort (they all share the first d characters)
+            for i in range(1, len(items)):
+                current = items[i]
+                current_val = strings[current]
+                j = i - 1
+                while j >= 0 and strings[items[j]] > current_val:
+                    items[j + 1] = items[j]
+                    j -= 1
+                items[j + 1] = current
+            result.extend(items)
+            continue
+
+        # Split the bucket by the character at position d
+        finished = []  # Strings that end right here sort before any longer one
+        buckets = {}
+        for item in items:
+            value = strings[item]
+            if len(value) == d:
+                finished.append(item)
+            else:
+                ch = value[d]
+                if ch in buckets:
+                    buckets[ch].append(item)
+                else:
+                    buckets[ch] = [item]
+
+        # Only a handful of distinct characters per bucket, so insertion sort them
+        chars = list(buckets)
+        for i in range(1, len(chars)):
+            current = chars[i]
+            j = i - 1
+            while j >= 0 and chars[j] > current:
+                chars[j + 1] = chars[j]
+                j -= 1
+            chars[j + 1] = current
+
+        for ch in reversed(chars):
+            stack.append((buckets[ch], d + 1))
+        result.extend(finished)
+
     return result
+
+def string_radix_sort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    String Radix Sort - for text columns with lots of repeated values
+    1. Maps every key to a small code, so each distinct name is sorted only once
+    2. MSD Radix Sorts the distinct names (shared prefixes are only read once)
+    3. Counting Sorts the records by the rank of their name (stable)
+    O(n + total length of the distinct names) time, O(n) space
+    """
+    n = len(keys)
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Step 1: dictionary-encode the column
+    code_of = {}
+    distinct = []
+    codes = [0] * n
+    for i, k in enumerate(keys):
+        code = code_of.get(k)
+        if code is None:
+            if type(k) is not str:
+                raise ValueError(f"String Radix Sort only works on text columns (got {type(k).__name__})")
+            code = len(distinct)
+            code_of[k] = code
+            distinct.append(k)
+        codes[i] = code
+
+    if is_cancelled():
+        return None
+    if progress_callback:
+        progress_callback(25)
+
+    # Step 2: sort the (few) distinct names
+    stop = _CheckerEvent(is_cancelled)
+    sorted_codes = _msd_radix_order(distinct, cancel_event=stop)
+    if sorted_codes is None:
+        return None
+    if progress_callback:
+        progress_callback(50)
+
+    # Rank each distinct name, reversed for descending so the counting pass can stay ascending
+    last = len(distinct) - 1
+    rank_of = [0] * len(distinct)
+    for rank, code in enumerate(sorted_codes):
+        rank_of[code] = last - rank if descending else rank
+
+    # Step 3: stable counting sort on the ranks (radix_sort_indices takes the
+    # single counting pass here since there are never more ranks than records)
+    order = radix_sort_indices([rank_of[c] for c in codes], cancel_event=stop)
+    if order is None:
+        return None
+
+    # Instrumented run: the counting pass above moved every index once
+    counter = instrumentation.counter_of(keys)
+    if counter is not None:
+        counter.moves += n
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return order
+
+def string_radix_sort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    String Radix Sort over records, sorted by a text column
+    O(n + total length of the distinct values) time, O(n) space
+    """
+    return _sort_records(string_radix_sort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+# Introsort hands ranges this small to the final insertion sort pass
+INTROSORT_CUTOFF = 16
+
+def _heapsort_range(keys, order, lo, hi, lt):
+    """
+    Heapsort of keys[lo:hi] in place (introsort's fallback when the
+    quicksort pivots keep going wrong) - O(m log m), no extra memory
+    """
+    def sift_down(root, end):
+        key, index = keys[root], order[root]
+        while True:
+            child = lo + 2 * (root - lo) + 1
+            if child >= end:
+                break
+            # Follow the larger child
+            if child + 1 < end and lt(keys[child], keys[child + 1]):
+                child += 1
+            if not lt(key, keys[child]):
+                break
+            keys[root], order[root] = keys[child], order[child]
+            root = child
+        keys[root], order[root] = key, index
+
+    # Build a max-heap, then keep moving the largest to the back
+    for root in range(lo + (hi - lo) // 2 - 1, lo - 1, -1):
+        sift_down(root, hi)
+    for end in range(hi - 1, lo, -1):
+        keys[lo], keys[end] = keys[end], keys[lo]
+        order[lo], order[end] = order[end], order[lo]
+        sift_down(lo, end)
+
+def introsort_indices(keys, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Introsort - quicksort with a median-of-three pivot that switches to heapsort
+    for any range that recurses too deep, and leaves small ranges for one
+    insertion sort pass at the end (not stable)
+    O(n log n) time, O(log n) extra space besides the index permutation
+    """
+    # Work on a copy of the keys, the indices move right alongside them
+    keys = instrumentation.copy_keys(keys)
+    n = len(keys)
+    order = instrumentation.index_list(keys)
+    lt = operator.gt if descending else operator.lt
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+    report_every = max(n // PROGRESS_STEPS, 1)
+
+    # Ranges still to partition: (lo, hi, depth budget left)
+    # Always continuing with the smaller half keeps this stack O(log n)
+    stack = [(0, n, 2 * max(n.bit_length() - 1, 0))]
+    settled = 0
+    next_report = report_every
+    work_done = 0
+    next_check = 0
+
+    while stack:
+        lo, hi, depth = stack.pop()
+
+        while hi - lo > INTROSORT_CUTOFF:
+            # Check if user pressed STOP
+            if work_done >= next_check:
+                if is_cancelled():
+                    return None
+                next_check = work_done + CANCEL_CHECK_EVERY
+            work_done += hi - lo
+
+            if depth == 0:
+                # Too many bad pivots: heapsort is O(m log m) no matter what
+                _heapsort_range(keys, order, lo, hi, lt)
+                break
+            depth -= 1
+
+            # Median of three: sort first, middle and last, the middle one is the pivot
+            mid = (lo + hi - 1) // 2
+            last = hi - 1
+            if lt(keys[mid], keys[lo]):
+                keys[lo], keys[mid] = keys[mid], keys[lo]
+                order[lo], order[mid] = order[mid], order[lo]
+            if lt(keys[last], keys[lo]):
+                keys[lo], keys[last] = keys[last], keys[lo]
+                order[lo], order[last] = order[last], order[lo]
+            if lt(keys[last], keys[mid]):
+                keys[mid], keys[last] = keys[last], keys[mid]
+                order[mid], order[last] = order[last], order[mid]
+            pivot = keys[mid]
+
+            # Hoare partition: walk in from both ends and swap pairs on the wrong side
+            # (stopping on keys equal to the pivot keeps runs of duplicates balanced)
+            i, j = lo, last
+            while i <= j:
+                while lt(keys[i], pivot):
+                    i += 1
+                while lt(pivot, keys[j]):
+                    j -= 1
+                if i <= j:
+                    keys[i], keys[j] = keys[j], keys[i]
+                    order[i], order[j] = order[j], order[i]
+                    i += 1
+                    j -= 1
+
+            # [lo, j] <= pivot <= [i, hi): save the bigger side for later
+            if j + 1 - lo < hi - i:
+                stack.append((i, hi, depth))
+                hi = j + 1
+            else:
+                stack.append((lo, j + 1, depth))
+                lo = i
+
+        settled += hi - lo
+
+        # Update progress bar every few items
+        if progress_callback and settled >= next_report:
+            progress_callback(settled / n * 90)
+            next_report = settled + report_every
+
+    # Every item is now within INTROSORT_CUTOFF of its spot: one insertion sort pass finishes it
+    for i in range(1, n):
+        current_val = keys[i]
+        current_index = order[i]
+        j = i - 1
+        while j >= 0 and lt(current_val, keys[j]):
+            keys[j + 1] = keys[j]
+            order[j + 1] = order[j]
+            j -= 1
+        keys[j + 1] = current_val
+        order[j + 1] = current_index
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return order
+
+def introsort(data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Sorts records using Introsort (quicksort + heapsort fallback + insertion sort)
+    """
+    return _sort_records(introsort_indices, data, key, descending, progress_callback, cancel_event, deadline)
+
+def _sift_down(heap_keys, heap_index, pos, size, worse):
+    """
+    Moves heap entry pos down until both children are no worse than it
+    worse(a_key, a_index, b_key, b_index) says whether a belongs after b
+    """
+    key, index = heap_keys[pos], heap_index[pos]
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        # Pick the worse of the two children
+        right = child + 1
+        if right < size and worse(heap_keys[right], heap_index[right], heap_keys[child], heap_index[child]):
+            child = right
+        if not worse(heap_keys[child], heap_index[child], key, index):
+            break
+        heap_keys[pos], heap_index[pos] = heap_keys[child], heap_index[child]
+        pos = child
+    heap_keys[pos], heap_index[pos] = key, index
+
+def heap_top_k_indices(keys, k, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Heap Top-K - keeps the k best keys seen so far in a heap whose root is the
+    worst of them; a new key only goes in if it beats the root
+    O(n log k) time, O(k) space
+    Returns the indices of the first k keys of the stable sorted order
+    """
+    n = len(keys)
+    k = max(min(k, n), 0)
+    if k == 0:
+        return []
+
+    # a comes after b in the sorted order: bigger key (smaller when descending),
+    # equal keys by position so the result matches a stable sort
+    if descending:
+        def worse(a_key, a_index, b_key, b_index):
+            return a_key < b_key or (a_key == b_key and a_index > b_index)
+    else:
+        def worse(a_key, a_index, b_key, b_index):
+            return a_key > b_key or (a_key == b_key and a_index > b_index)
+
+    # Setup cancel checker
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # One countdown for both the STOP check and the progress bar, whichever is due more often
+    check_every = min(CANCEL_CHECK_EVERY, max(n // PROGRESS_STEPS, 1))
+
+    # Heapify the first k keys
+    heap_keys = list(keys[:k])
+    heap_index = instrumentation.index_list(keys, k)
+    for pos in range(k // 2 - 1, -1, -1):
+        _sift_down(heap_keys, heap_index, pos, k, worse)
+
+    # Later keys have bigger positions, so a tie with the root never beats it:
+    # only strictly better keys replace the root
+    beats = operator.gt if descending else operator.lt
+    next_check = k
+    for i in range(k, n):
+        # Check if user pressed STOP and update the progress bar every few items
+        if i >= next_check:
+            if is_cancelled():
+                return None
+            if progress_callback:
+                progress_callback(i / n * 95)
+            next_check = i + check_every
+
+        key = keys[i]
+        if beats(key, heap_keys[0]):
+            heap_keys[0], heap_index[0] = key, i
+            _sift_down(heap_keys, heap_index, 0, k, worse)
+
+    # Heapsort the survivors: repeatedly move the worst one to the back
+    for end in range(k - 1, 0, -1):
+        heap_keys[0], heap_keys[end] = heap_keys[end], heap_keys[0]
+        heap_index[0], heap_index[end] = heap_index[end], heap_index[0]
+        _sift_down(heap_keys, heap_index, 0, end, worse)
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return heap_index
+
+def quickselect_top_k_indices(keys, k, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Introselect Top-K - quickselect splits the keys around a median-of-three
+    pivot and only keeps going into the side that holds the k-th key, then the
+    k winners get sorted; falls back to the heap if the pivots keep being bad
+    O(n + k log k) average time, O(n log k) worst case, O(n) space
+    Returns the indices of the first k keys of the stable sorted order
+    """
+    n = len(keys)
+    k = max(min(k, n), 0)
+    if k == 0:
+        return []
+
+    before = operator.gt if descending else operator.lt
+    is_cancelled = cancel_checker(cancel_event, deadline)
+
+    # Each partition keeps positions in their original order, so equal keys
+    # stay in position order and the final stable sort gets the ties right
+    candidates = list(range(n))
+    selected = instrumentation.index_list(keys, 0)
+    needed = k
+    counter = instrumentation.counter_of(keys)
+    depth_limit = 2 * max(n.bit_length(), 1)
+
+    while needed > 0:
+        # Check if user pressed STOP
+        if is_cancelled():
+            return None
+
+        if needed == len(candidates):
+            selected.extend(candidates)
+            break
+
+        depth_limit -= 1
+        if depth_limit < 0:
+            # Too many lopsided splits: let the heap finish the job
+            rest = heap_top_k_indices([keys[i] for i in candidates], needed, descending,
+                                      cancel_event=_CheckerEvent(is_cancelled))
+            if rest is None:
+                return None
+            selected.extend(candidates[i] for i in rest)
+            break
+
+        # Median of three pivot (first, middle, last candidate)
+        a, b, c = keys[candidates[0]], keys[candidates[len(candidates) // 2]], keys[candidates[-1]]
+        if before(b, a):
+            a, b = b, a
+        if before(c, b):
+            b = a if before(c, a) else c
+        pivot = b
+
+        # Three-way split: keys that come before the pivot, equal to it, after it
+        first = [i for i in candidates if before(keys[i], pivot)]
+        equal = [i for i in candidates if keys[i] == pivot]
+        if counter is not None:
+            counter.moves += len(first) + len(equal)
+
+        if needed <= len(first):
+            candidates = first
+        elif needed <= len(first) + len(equal):
+            # The k-th key is the pivot: earliest positions win the ties
+            selected.extend(first)
+            selected.extend(equal[:needed - len(first)])
+            break
+        else:
+            selected.extend(first)
+            selected.extend(equal)
+            needed -= len(first) + len(equal)
+            candidates = [i for i in candidates if before(pivot, keys[i])]
+            if counter is not None:
+                counter.moves += len(candidates)
+
+        if progress_callback:
+            progress_callback((1 - len(candidates) / n) * 80)
+
+    # Stable sort of just the k winners (each key's winners are already in position order)
+    order = merge_sort_indices([keys[i] for i in selected], descending,
+                               cancel_event=_CheckerEvent(is_cancelled))
+    if order is None:
+        return None
+
+    # Set progress to 100%
+    if progress_callback:
+        progress_callback(100)
+    return [selected[i] for i in order]
+
+def heap_top_k(data, key, k, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    First k records in sorted order, using Heap Top-K
+    """
+    return top_k_records("Heap Top-K", data, key, k, descending, progress_callback, cancel_event, deadline)
+
+def quickselect_top_k(data, key, k, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    First k records in sorted order, using Introselect Top-K
+    """
+    return top_k_records("Quickselect Top-K", data, key, k, descending, progress_callback, cancel_event, deadline)
+
+# Index sorts by the name the GUI shows for them
+ALGORITHMS = {
+    "Merge Sort": merge_sort_indices,
+    "Hybrid Merge Sort": hybrid_merge_sort_indices,
+    "Bottom-Up Merge Sort": bottom_up_merge_sort_indices,
+    "Adaptive Merge Sort": adaptive_merge_sort_indices,
+    "Parallel Merge Sort": parallel_merge_sort_indices,
+    "Introsort": introsort_indices,
+    "Bubble Sort": bubble_sort_indices,
+    "Insertion Sort": insertion_sort_indices,
+    "Radix Sort": radix_sort_indices,
+    "Counting Sort": counting_sort_indices,
+    "String Radix Sort": string_radix_sort_indices,
+}
+
+# Optional production-speed reference (NumPy's compiled sort), only when NumPy is installed
+if native_backend.available():
+    ALGORITHMS[native_backend.NATIVE_BASELINE] = native_backend.numpy_sort_indices
+
+# Algorithms that only accept integer keys (the GUI disables them for text columns)
+INTEGER_KEY_ALGORITHMS = ("Radix Sort", "Counting Sort")
+
+# Algorithms that only accept text keys (the GUI disables them for integer columns)
+STRING_KEY_ALGORITHMS = ("String Radix Sort",)
+
+# Partial sorts: (keys, k, descending, ...) -> indices of the first k sorted keys
+TOP_K_ALGORITHMS = {
+    "Heap Top-K": heap_top_k_indices,
+    "Quickselect Top-K": quickselect_top_k_indices,
+}
+
+# Algorithms that never compare two keys (they do arithmetic on them instead),
+# so count_operations hands them the raw values and only counts lookups and moves
+NON_COMPARISON_ALGORITHMS = INTEGER_KEY_ALGORITHMS + STRING_KEY_ALGORITHMS
+
+# Algorithms that may reorder equal keys. Every other algorithm gives the one
+# stable order, so e.g. a cached order of 10,000 rows also answers 5,000 rows
+UNSTABLE_ALGORITHMS = ("Introsort",)
+
+def sort_records(algorithm, data, key, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Sorts records with the algorithm registered under the given name
+    Returns None if cancelled or if it ran past deadline seconds
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown sorting algorithm: {algorithm}")
+    return _sort_records(ALGORITHMS[algorithm], data, key, descending, progress_callback, cancel_event, deadline)
+
+def composite_keys(data, spec, cancel_event=None):
+    """
+    Turns a multi-column sort spec such as
+        [("LastName", False), ("FirstName", False), ("ID", True)]   (column, descending)
+    into ONE integer key per record, so any algorithm can do the whole sort in a
+    single pass with plain int comparisons instead of comparing column by column
+
+    Each column's values are replaced by their rank among the column's distinct
+    values (flipped for descending columns), then the ranks are packed together:
+        key = (rank1 * size2 + rank2) * size3 + rank3
+    Returns None if cancelled
+    """
+    n = len(data)
+    packed = [0] * n
+
+    for column, descending in spec:
+        column_keys = extract_keys(data, column)
+
+        # Distinct values of this column (usually far fewer than n)
+        rank_of = {}
+        for value in column_keys:
+            if value not in rank_of:
+                rank_of[value] = 0
+        distinct = list(rank_of)
+
+        # Sort the distinct values once to get their ranks
+        sorted_distinct = bottom_up_merge_sort_indices(distinct, descending, cancel_event=cancel_event)
+        if sorted_distinct is None:
+            return None
+        for rank, position in enumerate(sorted_distinct):
+            rank_of[distinct[position]] = rank
+
+        size = len(distinct)
+        packed = [p * size + rank_of[value] for p, value in zip(packed, column_keys)]
+
+    return packed
+
+def top_k_records(method, data, key, k, descending=False, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    The first k records of the sorted order, without sorting the other n - k
+    method is a TOP_K_ALGORITHMS name; returns None if cancelled or timed out
+    """
+    order = top_k_order(method, data, [(key, descending)], k, progress_callback, cancel_event, deadline)
+    if order is None:
+        return None
+    return apply_order(data, order)
+
+def top_k_order(method, data, spec, k, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Like sort_order, but only the first k positions of the sorted order
+    """
+    if method not in TOP_K_ALGORITHMS:
+        raise ValueError(f"Unknown top-k method: {method}")
+    if not spec:
+        raise ValueError("Sorting needs at least one column")
+
+    if len(spec) == 1:
+        column, descending = spec[0]
+        return TOP_K_ALGORITHMS[method](extract_keys(data, column), k, descending,
+                                        progress_callback, cancel_event, deadline)
+
+    stop = _CheckerEvent(cancel_checker(cancel_event, deadline))
+    keys = composite_keys(data, spec, stop)
+    if keys is None:
+        return None
+    return TOP_K_ALGORITHMS[method](keys, k, False, progress_callback, stop)
+
+def sort_order(algorithm, data, spec, progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Like multi_key_sort / sort_records, but returns the index permutation
+    instead of the records (what the GUI's result cache keeps)
+    spec is a list of (column, descending) pairs, most significant column first
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown sorting algorithm: {algorithm}")
+    if not spec:
+        raise ValueError("Sorting needs at least one column")
+
+    if len(spec) == 1:
+        column, descending = spec[0]
+        return ALGORITHMS[algorithm](extract_keys(data, column), descending,
+                                     progress_callback, cancel_event, deadline)
+
+    # Start the clock now so building the composite keys counts against the deadline
+    stop = _CheckerEvent(cancel_checker(cancel_event, deadline))
+    keys = composite_keys(data, spec, stop)
+    if keys is None:
+        return None
+    return ALGORITHMS[algorithm](keys, False, progress_callback, stop)
+
+def multi_key_sort(data, spec, algorithm="Merge Sort", progress_callback=None, cancel_event=None, deadline=None):
+    """
+    Sorts records by several columns at once, e.g. LastName, then FirstName, then ID
+    spec is a list of (column, descending) pairs, most significant column first
+    Ties on every column keep their original order when the algorithm is stable
+    """
+    order = sort_order(algorithm, data, spec, progress_callback, cancel_event, deadline)
+    if order is None:
+        return None
+    return apply_order(data, order)
+
+def count_operations(algorithm, data, spec, k=None, cancel_event=None, deadline=None):
+    """
+    Sorts once more over instrumented keys and returns what the sort did as an
+    instrumentation.OpCounter (comparisons, moves, key lookups, peak memory)
+    With k, algorithm is a TOP_K_ALGORITHMS method and only the first k are counted
+    Many times slower than a normal run, so never time it; returns None if cancelled
+    """
+    if algorithm == native_backend.NATIVE_BASELINE:
+        raise ValueError("The native baseline sorts inside NumPy, so its operations can't be counted")
+    if k is None:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown sorting algorithm: {algorithm}")
+        index_sort = ALGORITHMS[algorithm]
+    else:
+        if algorithm not in TOP_K_ALGORITHMS:
+            raise ValueError(f"Unknown top-k method: {algorithm}")
+        top_k = TOP_K_ALGORITHMS[algorithm]
+        index_sort = lambda keys, descending, progress, cancel, limit: top_k(keys, k, descending, progress, cancel, limit)
+    if not spec:
+        raise ValueError("Sorting needs at least one column")
+
+    if len(spec) == 1:
+        column, descending = spec[0]
+        keys = extract_keys(data, column)
+    else:
+        # Building the composite keys isn't part of the count, only the sort itself
+        descending = False
+        keys = composite_keys(data, spec, cancel_event)
+        if keys is None:
+            return None
+
+    return instrumentation.count_operations(index_sort, keys, descending,
+                                            compare=algorithm not in NON_COMPARISON_ALGORITHMS,
+                                            cancel_event=cancel_event, deadline=deadline)
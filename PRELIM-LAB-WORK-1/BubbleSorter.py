@@ -1,4 +1,22 @@
+import mmap
+import os
+import sys
 import time
+import tracemalloc
+import warnings
+from array import array
+ 
+# NumPy is optional, it's only used for the native baseline at the end
+try:
+    import numpy as np
+except ImportError:
+    np = None
+ 
+# Elements shown at each end of the list in summary mode (--summary)
+SUMMARY_COUNT = 10
+ 
+# Bytes parsed at a time when reading a memory-mapped file (read_dataset(use_mmap=True))
+MMAP_BLOCK_BYTES = 1 << 22
  
 def bubble_sort_descending(arr):
     """
@@ -35,41 +53,222 @@ def bubble_sort_descending(arr):
     return arr, time_taken
  
  
-def read_dataset(filename):
+def numpy_sort_descending(arr):
+    """
+    Sorts an array in DESCENDING order with NumPy's compiled sort.
+    This is the "native baseline": a production-speed reference to compare
+    the hand-written sorts against (the time includes converting the list).
+   
+    Args:
+        arr: List of numbers to sort
+       
+    Returns:
+        Tuple of (sorted list, time taken in seconds), or None without NumPy
+    """
+    if np is None:
+        return None
+   
+    start_time = time.time()
+   
+    values = np.array(arr)
+    sorted_arr = np.sort(values, kind='stable')[::-1].tolist()
+   
+    end_time = time.time()
+    time_taken = end_time - start_time
+   
+    return sorted_arr, time_taken
+ 
+ 
+class OperationCounter:
+    """
+    Totals of one instrumented sort: comparisons, moves (element writes),
+    key lookups (element reads) and the peak auxiliary memory in bytes.
+    """
+   
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.key_lookups = 0
+        self.peak_bytes = 0
+ 
+ 
+class CountedValue:
+    """
+    Wraps one element and counts every comparison made with it.
+    """
+   
+    __slots__ = ('value', 'counter')
+   
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+   
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+   
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+ 
+ 
+class CountingList(list):
+    """
+    A list that counts element reads as key lookups and element writes as moves.
+    """
+   
+    def __init__(self, iterable=(), counter=None):
+        super().__init__(iterable)
+        self.counter = counter
+   
+    def __getitem__(self, index):
+        self.counter.key_lookups += 1
+        return list.__getitem__(self, index)
+   
+    def __setitem__(self, index, value):
+        self.counter.moves += 1
+        list.__setitem__(self, index, value)
+ 
+ 
+def count_operations(sort_function, arr):
+    """
+    Runs the sort over instrumented elements and counts what it does.
+    Normal runs never see these wrappers, so they cost nothing unless
+    you ask for a count (and a counted run is much slower).
+   
+    Args:
+        sort_function: e.g. bubble_sort_descending
+        arr: List of comparable elements (left unchanged)
+       
+    Returns:
+        OperationCounter with the totals
+    """
+    counter = OperationCounter()
+    counted = CountingList([CountedValue(x, counter) for x in arr], counter)
+   
+    # Only memory the sort itself allocates counts, not the wrappers above
+    # Stop tracing even if the sort raises, so it doesn't slow everything after it
+    tracemalloc.start()
+    try:
+        sort_function(counted)
+        counter.peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+   
+    return counter
+ 
+ 
+def parse_integers_numpy(content):
+    """
+    Parses whitespace-separated integers with NumPy's C parser, several
+    times faster than int() on every token.
+   
+    Args:
+        content: File contents (bytes) with commas already replaced by spaces
+       
+    Returns:
+        NumPy int64 array, or None if NumPy isn't installed or the data doesn't fit
+    """
+    if np is None:
+        return None
+    try:
+        with warnings.catch_warnings():
+            # Unparsable data is only a warning by default, make it an error
+            warnings.simplefilter("error")
+            values = np.fromstring(content, dtype=np.int64, sep=' ')
+    except (ValueError, DeprecationWarning):
+        return None
+   
+    # Numbers too big for int64 get clamped silently, let the pure Python parser handle them
+    limits = np.iinfo(np.int64)
+    if len(values) and (values.max() == limits.max or values.min() == limits.min):
+        return None
+    return values
+ 
+ 
+def parse_numbers(content):
+    """
+    Parses a block of the file: numbers separated by commas, spaces or newlines.
+   
+    Args:
+        content: Bytes holding whole numbers (never cut in half)
+       
+    Returns:
+        NumPy int64 array if NumPy parsed it, otherwise a list of the numbers
+        (float if written with a '.', int otherwise)
+    """
+    # Commas become whitespace, then one split handles commas, spaces and newlines alike
+    content = content.replace(b',', b' ')
+   
+    if b'.' not in content:
+        # All integers: NumPy parses them in C if it's installed, otherwise int() parses the bytes directly
+        parsed = parse_integers_numpy(content)
+        if parsed is not None:
+            return parsed
+        return list(map(int, content.split()))
+    return [float(x) if b'.' in x else int(x) for x in content.split()]
+ 
+ 
+def mapped_blocks(mapped):
+    """
+    Yields a memory-mapped file in blocks of about MMAP_BLOCK_BYTES, each
+    ending on a separator so no number is cut in half. Only one block is
+    copied out of the mapping at a time, never the whole file.
+   
+    Args:
+        mapped: The mmap of the file
+       
+    Returns:
+        Generator of bytes blocks
+    """
+    size = len(mapped)
+    start = 0
+    while start < size:
+        end = min(start + MMAP_BLOCK_BYTES, size)
+        # Move the end forward to the next separator
+        while end < size and mapped[end] not in b' \t\r\n,':
+            end += 1
+        yield mapped[start:end]
+        start = end
+ 
+ 
+def read_dataset(filename, as_array=False, use_mmap=False):
     """
     Reads numbers from a file and returns them as a list.
     Each number should be on a separate line or separated by spaces/commas.
+    The whole file is read in one go and parsed in bulk instead of line by line.
    
     Args:
         filename: Path to the file containing numbers
+        as_array: Return a compact array.array ('q' for ints, 'd' if there are floats) instead of a list
+        use_mmap: Memory-map the file and parse it block by block, so the file's text is never all in memory at once
        
     Returns:
-        List of numbers read from the file
+        List (or array) of numbers read from the file
     """
     try:
-        with open(filename, 'r') as file:
-            numbers = []
-            for line in file:
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        # Try to convert to int or float
-                        if '.' in line:
-                            numbers.append(float(line))
-                        else:
-                            numbers.append(int(line))
-                    except ValueError:
-                        # If a line contains multiple numbers separated by spaces or commas
-                        if ',' in line:
-                            nums = [float(x.strip()) if '.' in x.strip() else int(x.strip())
-                                   for x in line.split(',') if x.strip()]
-                            numbers.extend(nums)
-                        else:
-                            nums = [float(x.strip()) if '.' in x.strip() else int(x.strip())
-                                   for x in line.split() if x.strip()]
-                            numbers.extend(nums)
-           
-            return numbers
+        with open(filename, 'rb') as file:
+            if use_mmap and os.path.getsize(filename) > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    parts = [parse_numbers(block) for block in mapped_blocks(mapped)]
+            else:
+                parts = [parse_numbers(file.read())]
+       
+        if as_array and not any(type(part) is list for part in parts):
+            # All parsed by NumPy: copy the int64 bytes straight into the array
+            values = array('q')
+            for part in parts:
+                values.frombytes(part.tobytes())
+            return values
+       
+        numbers = []
+        for part in parts:
+            numbers.extend(part if type(part) is list else part.tolist())
+       
+        if as_array:
+            has_floats = any(type(x) is float for x in numbers)
+            return array('d' if has_floats else 'q', numbers)
+        return numbers
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
@@ -78,6 +277,39 @@ def read_dataset(filename):
         return None
  
  
+def write_sorted_output(sorted_data, output_file=None, summary_only=False):
+    """
+    Writes the sorted elements in one go (a single join and write) instead of
+    one print() per element, which is slower than the sort on a slow terminal.
+   
+    Args:
+        sorted_data: The sorted list
+        output_file: Path to write every element to instead of the screen (None = screen)
+        summary_only: Only show the first and last SUMMARY_COUNT elements on screen
+   
+    Returns:
+        Time taken to write the output in seconds
+    """
+    start_time = time.time()
+   
+    if output_file is not None:
+        with open(output_file, 'w') as file:
+            file.write("\n".join(map(str, sorted_data)) + "\n")
+        print(f"All {len(sorted_data)} sorted elements written to '{output_file}'")
+   
+    if summary_only and len(sorted_data) > 2 * SUMMARY_COUNT:
+        # Just the two ends, the verification below still checks every element
+        lines = list(map(str, sorted_data[:SUMMARY_COUNT]))
+        lines.append(f"... ({len(sorted_data) - 2 * SUMMARY_COUNT} more) ...")
+        lines.extend(map(str, sorted_data[-SUMMARY_COUNT:]))
+        sys.stdout.write("\n".join(lines) + "\n")
+    elif output_file is None:
+        sys.stdout.write("\n".join(map(str, sorted_data)) + "\n")
+    sys.stdout.flush()
+   
+    return time.time() - start_time
+ 
+ 
 # Main program
 if __name__ == "__main__":
     filename = "dataset.txt"
@@ -94,16 +326,35 @@ if __name__ == "__main__":
         print("SORTING COMPLETE!\n")
         print("Sorted elements (descending order):\n")
        
-        # Print EVERY SINGLE element
-        for i, num in enumerate(sorted_data, 1):
-            print(f"{num}")
+        # Optional: python BubbleSorter.py --summary / --output sorted.txt
+        output_file = None
+        if "--output" in sys.argv and sys.argv.index("--output") + 1 < len(sys.argv):
+            output_file = sys.argv[sys.argv.index("--output") + 1]
+        output_time = write_sorted_output(sorted_data, output_file, "--summary" in sys.argv)
        
         print(f"\n==========================================")
         print(f"Time taken: {time_taken:.6f} seconds")
+        print(f"Output time: {output_time:.6f} seconds (not part of the sort time)")
         print(f"Total elements sorted: {len(sorted_data)}")
        
         # Verify
         is_sorted = all(sorted_data[i] >= sorted_data[i+1] for i in range(len(sorted_data)-1))
         print(f"Verification: {'✓ CORRECT!' if is_sorted else '✗ FAILED!'}")
+       
+        # Native baseline: the same data through NumPy's compiled sort
+        baseline = numpy_sort_descending(data.copy())
+        if baseline is not None:
+            _, numpy_time = baseline
+            print(f"\nNumPy baseline: {numpy_time:.6f} seconds "
+                  f"(bubble sort took {time_taken / max(numpy_time, 1e-9):,.0f}x as long)")
+       
+        # Optional: python BubbleSorter.py --count (one extra, much slower instrumented run)
+        if "--count" in sys.argv:
+            print("\nCounting operations (instrumented run, this takes a while)...")
+            counter = count_operations(bubble_sort_descending, data)
+            print(f"Comparisons: {counter.comparisons:,}")
+            print(f"Swaps: {counter.moves // 2:,} ({counter.moves:,} element moves)")
+            print(f"Key lookups: {counter.key_lookups:,}")
+            print(f"Auxiliary memory: {counter.peak_bytes:,} bytes")
     else:
         print("Failed to read data.")
\ No newline at end of file
@@ -1,5 +1,28 @@
 import time
+import math
+import mmap
+import multiprocessing
+import multiprocessing.connection
 import os
+import sys
+import tracemalloc
+import warnings
+from array import array
+
+# NumPy is optional, it's only used for the native baseline in the comparison
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Elements shown at each end of the list in summary mode (--summary)
+SUMMARY_COUNT = 10
+
+# Bytes parsed at a time when reading a memory-mapped file (read_dataset(use_mmap=True))
+MMAP_BLOCK_BYTES = 1 << 22
+
+# Seconds each algorithm gets in Compare All Sorting Times (--time-limit)
+COMPARE_TIME_LIMIT = 60
 
 def bubble_sort_descending(arr):
     """
@@ -82,7 +105,8 @@ def merge_sort_descending(arr):
         return merge(left, right)
     
     def merge(left, right):
-        result = []
+        # Empty list of the same kind as left, so count_operations sees these moves too
+        result = left[:0]
         i = j = 0
         
         while i < len(left) and j < len(right):
@@ -105,39 +129,330 @@ def merge_sort_descending(arr):
     return sorted_arr, time_taken
 
 
-def read_dataset(filename):
+def introsort_descending(arr):
+    """
+    Sorts an array in DESCENDING order using introsort: quicksort with a
+    median-of-three pivot, heapsort when the recursion gets too deep, and
+    insertion sort for small slices. Sorts in place, no extra lists.
+    
+    Args:
+        arr: List of comparable elements to sort
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds)
+    """
+    start_time = time.time()
+    
+    def heapsort(lo, hi):
+        # Min-heap on arr[lo:hi], smallest moves to the back each round
+        def sift_down(root, end):
+            while True:
+                child = lo + 2 * (root - lo) + 1
+                if child >= end:
+                    break
+                if child + 1 < end and arr[child + 1] < arr[child]:
+                    child += 1
+                if arr[root] <= arr[child]:
+                    break
+                arr[root], arr[child] = arr[child], arr[root]
+                root = child
+        
+        for root in range(lo + (hi - lo) // 2 - 1, lo - 1, -1):
+            sift_down(root, hi)
+        for end in range(hi - 1, lo, -1):
+            arr[lo], arr[end] = arr[end], arr[lo]
+            sift_down(lo, end)
+    
+    def insertion_sort(lo, hi):
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and arr[j] < key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    
+    def introsort_helper(lo, hi, depth):
+        while hi - lo > 16:
+            if depth == 0:
+                heapsort(lo, hi)
+                return
+            depth -= 1
+            
+            # Median of three, largest first since we sort descending
+            mid = (lo + hi - 1) // 2
+            if arr[mid] > arr[lo]:
+                arr[lo], arr[mid] = arr[mid], arr[lo]
+            if arr[hi - 1] > arr[lo]:
+                arr[lo], arr[hi - 1] = arr[hi - 1], arr[lo]
+            if arr[hi - 1] > arr[mid]:
+                arr[mid], arr[hi - 1] = arr[hi - 1], arr[mid]
+            pivot = arr[mid]
+            
+            i, j = lo, hi - 1
+            while i <= j:
+                while arr[i] > pivot:
+                    i += 1
+                while arr[j] < pivot:
+                    j -= 1
+                if i <= j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    i += 1
+                    j -= 1
+            
+            # Recurse into the smaller side, loop on the bigger one
+            if j + 1 - lo < hi - i:
+                introsort_helper(lo, j + 1, depth)
+                lo = i
+            else:
+                introsort_helper(i, hi, depth)
+                hi = j + 1
+        
+        insertion_sort(lo, hi)
+    
+    introsort_helper(0, len(arr), 2 * max(len(arr).bit_length() - 1, 0))
+    
+    end_time = time.time()
+    time_taken = end_time - start_time
+    
+    return arr, time_taken
+
+
+def numpy_sort_descending(arr):
+    """
+    Sorts an array in DESCENDING order with NumPy's compiled sort.
+    This is the "native baseline": a production-speed reference to compare
+    the hand-written sorts against (the time includes converting the list).
+    
+    Args:
+        arr: List of numbers to sort
+        
+    Returns:
+        Tuple of (sorted list, time taken in seconds), or None without NumPy
+    """
+    if np is None:
+        return None
+    
+    start_time = time.time()
+    
+    values = np.array(arr)
+    sorted_arr = np.sort(values, kind='stable')[::-1].tolist()
+    
+    end_time = time.time()
+    time_taken = end_time - start_time
+    
+    return sorted_arr, time_taken
+
+
+class OperationCounter:
+    """
+    Totals of one instrumented sort: comparisons, moves (element writes),
+    key lookups (element reads) and the peak auxiliary memory in bytes.
+    """
+    
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.key_lookups = 0
+        self.peak_bytes = 0
+
+
+class CountedValue:
+    """
+    Wraps one element and counts every comparison made with it.
+    """
+    
+    __slots__ = ('value', 'counter')
+    
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+    
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+    
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+    
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+    
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+
+
+class CountingList(list):
+    """
+    A list that counts element reads as key lookups and element writes as
+    moves. Slices stay CountingLists, so merge sort's halves are counted too.
+    """
+    
+    def __init__(self, iterable=(), counter=None):
+        super().__init__(iterable)
+        self.counter = counter
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountingList(list.__getitem__(self, index), self.counter)
+        self.counter.key_lookups += 1
+        return list.__getitem__(self, index)
+    
+    def __setitem__(self, index, value):
+        self.counter.moves += len(value) if isinstance(index, slice) else 1
+        list.__setitem__(self, index, value)
+    
+    def append(self, value):
+        self.counter.moves += 1
+        list.append(self, value)
+    
+    def extend(self, values):
+        self.counter.moves += len(values)
+        list.extend(self, values)
+
+
+def count_operations(sort_function, arr):
+    """
+    Runs one of the *_descending sorts over instrumented elements and counts
+    what it does. Normal runs never see these wrappers, so they cost nothing
+    unless you ask for a count (and a counted run is much slower).
+    
+    Args:
+        sort_function: e.g. bubble_sort_descending
+        arr: List of comparable elements (left unchanged)
+        
+    Returns:
+        OperationCounter with the totals
+    """
+    counter = OperationCounter()
+    counted = CountingList([CountedValue(x, counter) for x in arr], counter)
+    
+    # Only memory the sort itself allocates counts, not the wrappers above
+    # Stop tracing even if the sort raises, so it doesn't slow everything after it
+    tracemalloc.start()
+    try:
+        sort_function(counted)
+        counter.peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    
+    return counter
+
+
+def parse_integers_numpy(content):
+    """
+    Parses whitespace-separated integers with NumPy's C parser, several
+    times faster than int() on every token.
+    
+    Args:
+        content: File contents (bytes) with commas already replaced by spaces
+        
+    Returns:
+        NumPy int64 array, or None if NumPy isn't installed or the data doesn't fit
+    """
+    if np is None:
+        return None
+    try:
+        with warnings.catch_warnings():
+            # Unparsable data is only a warning by default, make it an error
+            warnings.simplefilter("error")
+            values = np.fromstring(content, dtype=np.int64, sep=' ')
+    except (ValueError, DeprecationWarning):
+        return None
+    
+    # Numbers too big for int64 get clamped silently, let the pure Python parser handle them
+    limits = np.iinfo(np.int64)
+    if len(values) and (values.max() == limits.max or values.min() == limits.min):
+        return None
+    return values
+
+
+def parse_numbers(content):
+    """
+    Parses a block of the file: numbers separated by commas, spaces or newlines.
+    
+    Args:
+        content: Bytes holding whole numbers (never cut in half)
+        
+    Returns:
+        NumPy int64 array if NumPy parsed it, otherwise a list of the numbers
+        (float if written with a '.', int otherwise)
+    """
+    # Commas become whitespace, then one split handles commas, spaces and newlines alike
+    content = content.replace(b',', b' ')
+    
+    if b'.' not in content:
+        # All integers: NumPy parses them in C if it's installed, otherwise int() parses the bytes directly
+        parsed = parse_integers_numpy(content)
+        if parsed is not None:
+            return parsed
+        return list(map(int, content.split()))
+    return [float(x) if b'.' in x else int(x) for x in content.split()]
+
+
+def mapped_blocks(mapped):
+    """
+    Yields a memory-mapped file in blocks of about MMAP_BLOCK_BYTES, each
+    ending on a separator so no number is cut in half. Only one block is
+    copied out of the mapping at a time, never the whole file.
+    
+    Args:
+        mapped: The mmap of the file
+        
+    Returns:
+        Generator of bytes blocks
+    """
+    size = len(mapped)
+    start = 0
+    while start < size:
+        end = min(start + MMAP_BLOCK_BYTES, size)
+        # Move the end forward to the next separator
+        while end < size and mapped[end] not in b' \t\r\n,':
+            end += 1
+        yield mapped[start:end]
+        start = end
+
+
+def read_dataset(filename, as_array=False, use_mmap=False):
     """
     Reads numbers from a file and returns them as a list.
     Each number should be on a separate line or separated by spaces/commas.
+    The whole file is read in one go and parsed in bulk instead of line by line.
     
     Args:
         filename: Path to the file containing numbers
+        as_array: Return a compact array.array ('q' for ints, 'd' if there are floats) instead of a list
+        use_mmap: Memory-map the file and parse it block by block, so the file's text is never all in memory at once
         
     Returns:
-        List of numbers read from the file
+        List (or array) of numbers read from the file
     """
     try:
-        with open(filename, 'r') as file:
-            numbers = []
-            for line in file:
-                line = line.strip()
-                if line:
-                    try:
-                        if '.' in line:
-                            numbers.append(float(line))
-                        else:
-                            numbers.append(int(line))
-                    except ValueError:
-                        if ',' in line:
-                            nums = [float(x.strip()) if '.' in x.strip() else int(x.strip()) 
-                                   for x in line.split(',') if x.strip()]
-                            numbers.extend(nums)
-                        else:
-                            nums = [float(x.strip()) if '.' in x.strip() else int(x.strip()) 
-                                   for x in line.split() if x.strip()]
-                            numbers.extend(nums)
-            
-            return numbers
+        with open(filename, 'rb') as file:
+            if use_mmap and os.path.getsize(filename) > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    parts = [parse_numbers(block) for block in mapped_blocks(mapped)]
+            else:
+                parts = [parse_numbers(file.read())]
+    
+        if as_array and not any(type(part) is list for part in parts):
+            # All parsed by NumPy: copy the int64 bytes straight into the array
+            values = array('q')
+            for part in parts:
+                values.frombytes(part.tobytes())
+            return values
+    
+        numbers = []
+        for part in parts:
+            numbers.extend(part if type(part) is list else part.tolist())
+    
+        if as_array:
+            has_floats = any(type(x) is float for x in numbers)
+            return array('d' if has_floats else 'q', numbers)
+        return numbers
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
@@ -156,24 +471,60 @@ def display_menu():
     print("1. Bubble Sort")
     print("2. Insertion Sort")
     print("3. Merge Sort")
-    print("4. Compare All Sorting Times")
-    print("5. Exit")
+    print("4. Introsort")
+    print("5. Compare All Sorting Times")
+    print("6. Count Operations (comparisons, moves, ...)")
+    print("7. Exit")
     print("==========================================")
 
 
-def display_sorted_results(sorted_data, time_taken, algorithm_name):
+def write_sorted_output(sorted_data, output_file=None, summary_only=False):
+    """
+    Writes the sorted elements in one go (a single join and write) instead of
+    one print() per element, which is slower than the sort on a slow terminal.
+    
+    Args:
+        sorted_data: The sorted list
+        output_file: Path to write every element to instead of the screen (None = screen)
+        summary_only: Only show the first and last SUMMARY_COUNT elements on screen
+        
+    Returns:
+        Time taken to write the output in seconds
+    """
+    start_time = time.time()
+    
+    if output_file is not None:
+        with open(output_file, 'w') as file:
+            file.write("\n".join(map(str, sorted_data)) + "\n")
+        print(f"All {len(sorted_data)} sorted elements written to '{output_file}'")
+    
+    if summary_only and len(sorted_data) > 2 * SUMMARY_COUNT:
+        # Just the two ends, the verification still checks every element
+        lines = list(map(str, sorted_data[:SUMMARY_COUNT]))
+        lines.append(f"... ({len(sorted_data) - 2 * SUMMARY_COUNT} more) ...")
+        lines.extend(map(str, sorted_data[-SUMMARY_COUNT:]))
+        sys.stdout.write("\n".join(lines) + "\n")
+    elif output_file is None:
+        sys.stdout.write("\n".join(map(str, sorted_data)) + "\n")
+    sys.stdout.flush()
+    
+    return time.time() - start_time
+
+
+def display_sorted_results(sorted_data, time_taken, algorithm_name, output_file=None, summary_only=False):
     """
     Displays the sorted data and statistics.
+    output_file / summary_only are passed on to write_sorted_output.
     """
     print("\nSORTING COMPLETE!\n")
     print("Sorted elements (descending order):\n")
     
-    for num in sorted_data:
-        print(f"{num}")
+    output_time = write_sorted_output(sorted_data, output_file, summary_only)
     
     print(f"\n==========================================")
     print(f"Algorithm: {algorithm_name}")
     print(f"Time taken: {time_taken:.6f} seconds")
+    print(f"Output time: {output_time:.6f} seconds (not part of the sort time)")
     print(f"Total elements sorted: {len(sorted_data)}")
     
     is_sorted = all(sorted_data[i] >= sorted_data[i+1] for i in range(len(sorted_data)-1))
@@ -181,45 +532,179 @@ def display_sorted_results(sorted_data, time_taken, algorithm_name):
     print("==========================================")
 
 
-def compare_all_sorts(data):
+# Algorithms raced by compare_all_sorts: name -> (sort function, complexity used to extrapolate)
+COMPARE_ALGORITHMS = {
+    'Bubble Sort': (bubble_sort_descending, 'n²'),
+    'Insertion Sort': (insertion_sort_descending, 'n²'),
+    'Merge Sort': (merge_sort_descending, 'n log n'),
+    'Introsort': (introsort_descending, 'n log n'),
+}
+
+
+def timed_sort_worker(sort_function, arr, connection):
     """
-    Compares the performance of all three sorting algorithms.
+    Runs one sort in its own process and sends the time taken back through its own pipe.
+    Only the time is sent back, copying the sorted list between processes would cost more than the sort.
+    """
+    _, time_taken = sort_function(arr)
+    connection.send(time_taken)
+    connection.close()
+
+
+def estimate_time(sort_function, data, complexity, sample_size=2000):
+    """
+    Extrapolates how long a sort would take on all of data by timing it on
+    the first sample_size elements and scaling by its complexity.
+    
+    Args:
+        sort_function: One of the *_descending sorts
+        data: The full dataset
+        complexity: 'n²' or 'n log n'
+        sample_size: How many elements to actually sort
+        
+    Returns:
+        Estimated time in seconds for the full dataset
+    """
+    n = len(data)
+    m = min(n, sample_size)
+    _, sample_time = sort_function(data[:m])
+    if m < 2:
+        return sample_time
+    
+    if complexity == 'n²':
+        return sample_time * (n / m) ** 2
+    return sample_time * (n * math.log2(n)) / (m * math.log2(m))
+
+
+def compare_all_sorts(data, time_limit=COMPARE_TIME_LIMIT):
+    """
+    Compares the performance of all four sorting algorithms.
+    Each algorithm runs in its own worker process (as many at once as there are CPUs),
+    and one that takes longer than time_limit seconds is stopped and its time estimated instead.
     """
     print("\n==========================================")
     print("   COMPARING ALL SORTING ALGORITHMS")
     print("==========================================\n")
     
-    print("Running Bubble Sort...")
-    _, bubble_time = bubble_sort_descending(data.copy())
-    print(f"✓ Bubble Sort completed in {bubble_time:.6f} seconds")
+    workers = max(1, min(os.cpu_count() or 1, len(COMPARE_ALGORITHMS)))
+    print(f"Running {len(COMPARE_ALGORITHMS)} sorts on {workers} worker process(es), "
+          f"{time_limit:g}s limit each...\n")
     
-    print("\nRunning Insertion Sort...")
-    _, insertion_time = insertion_sort_descending(data.copy())
-    print(f"✓ Insertion Sort completed in {insertion_time:.6f} seconds")
+    pending = list(COMPARE_ALGORITHMS)
+    running = {}  # name -> (process, start time, receiving end of its pipe)
+    times = {}
+    timed_out = {}
     
-    print("\nRunning Merge Sort...")
-    _, merge_time = merge_sort_descending(data.copy())
-    print(f"✓ Merge Sort completed in {merge_time:.6f} seconds")
+    while pending or running:
+        # Start the next sorts while there are free CPUs
+        while pending and len(running) < workers:
+            name = pending.pop(0)
+            sort_function, _ = COMPARE_ALGORITHMS[name]
+            # One pipe per worker: stopping a worker halfway through sending can't affect the others
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=timed_sort_worker,
+                                              args=(sort_function, data.copy(), sender))
+            process.daemon = True
+            process.start()
+            sender.close()  # The worker has its own copy, this one would keep the pipe open
+            running[name] = (process, time.time(), receiver)
+        
+        # Collect finished sorts
+        receivers = {receiver: name for name, (_, _, receiver) in running.items()}
+        for receiver in multiprocessing.connection.wait(list(receivers), timeout=0.05):
+            name = receivers[receiver]
+            process, _, _ = running.pop(name)
+            try:
+                time_taken = receiver.recv()
+            except EOFError:
+                # The pipe closed without a result: the worker crashed
+                time_taken = None
+            receiver.close()
+            process.join()
+            
+            if time_taken is None:
+                print(f"✗ {name} crashed (exit code {process.exitcode})")
+            else:
+                times[name] = time_taken
+                print(f"✓ {name} completed in {time_taken:.6f} seconds")
+        
+        # Stop the ones over the time limit
+        now = time.time()
+        for name, (process, started, receiver) in list(running.items()):
+            if now - started > time_limit:
+                process.terminate()
+                process.join()
+                receiver.close()
+                del running[name]
+                timed_out[name] = now - started
+                print(f"✗ {name} timed out after {time_limit:g} s")
+    
+    # Estimate the timed-out ones from a small sample instead of waiting for them
+    estimates = {}
+    for name in timed_out:
+        sort_function, complexity = COMPARE_ALGORITHMS[name]
+        estimates[name] = estimate_time(sort_function, data, complexity)
     
     print("\n==========================================")
     print("           COMPARISON RESULTS")
     print("==========================================")
-    print(f"Bubble Sort:    {bubble_time:.6f} seconds")
-    print(f"Insertion Sort: {insertion_time:.6f} seconds")
-    print(f"Merge Sort:     {merge_time:.6f} seconds")
+    for name in COMPARE_ALGORITHMS:
+        if name in times:
+            print(f"{name + ':':<15} {times[name]:.6f} seconds")
+        elif name in estimates:
+            print(f"{name + ':':<15} timed out after {time_limit:g} s (estimated ~{estimates[name]:,.1f} seconds)")
+        else:
+            print(f"{name + ':':<15} failed")
     print("==========================================")
     
+    # Native baseline (not part of the race, it's the reference point)
+    baseline = numpy_sort_descending(data.copy())
+    if baseline is not None:
+        _, numpy_time = baseline
+        print(f"NumPy baseline: {numpy_time:.6f} seconds (native reference)")
+        for name in COMPARE_ALGORITHMS:
+            if name in times:
+                print(f"  {name + ':':<15} {times[name] / max(numpy_time, 1e-9):,.1f}x the baseline time")
+        print("==========================================")
+    
     # Determine the fastest
-    times = {
-        'Bubble Sort': bubble_time,
-        'Insertion Sort': insertion_time,
-        'Merge Sort': merge_time
-    }
+    if not times:
+        print(f"\nNo algorithm finished within {time_limit:g} seconds.")
+        print("==========================================")
+        return
     fastest = min(times, key=times.get)
     print(f"\n🏆 FASTEST: {fastest} ({times[fastest]:.6f} seconds)")
     print("==========================================")
 
 
+def count_all_operations(data):
+    """
+    Counts comparisons, moves, key lookups and auxiliary memory for all four
+    sorting algorithms (one instrumented run each).
+    """
+    print("\n==========================================")
+    print("   COUNTING OPERATIONS (instrumented runs)")
+    print("==========================================\n")
+    print("Much slower than a timed run: bubble sort alone can take a few minutes on 10,000 elements.\n")
+    
+    counts = {}
+    for name, sort_function in [('Bubble Sort', bubble_sort_descending),
+                                ('Insertion Sort', insertion_sort_descending),
+                                ('Merge Sort', merge_sort_descending),
+                                ('Introsort', introsort_descending)]:
+        print(f"Counting {name}...")
+        counts[name] = count_operations(sort_function, data)
+    
+    print("\n==========================================")
+    print("           OPERATION COUNTS")
+    print("==========================================")
+    print(f"{'Algorithm':<15} {'Comparisons':>13} {'Moves':>13} {'Key lookups':>13} {'Aux memory':>12}")
+    for name, counter in counts.items():
+        print(f"{name:<15} {counter.comparisons:>13,} {counter.moves:>13,} {counter.key_lookups:>13,} "
+              f"{counter.peak_bytes / 1024:>8,.0f} KiB")
+    print("==========================================")
+
+
 # Main program
 if __name__ == "__main__":
     # Get the directory where this script is located
@@ -238,33 +723,50 @@ if __name__ == "__main__":
     
     print(f"Dataset loaded: {len(data)} elements")
     
+    # Optional: python Sortingsystem.py --summary / --output sorted.txt
+    summary_only = "--summary" in sys.argv
+    output_file = None
+    if "--output" in sys.argv and sys.argv.index("--output") + 1 < len(sys.argv):
+        output_file = sys.argv[sys.argv.index("--output") + 1]
+    time_limit = COMPARE_TIME_LIMIT
+    if "--time-limit" in sys.argv and sys.argv.index("--time-limit") + 1 < len(sys.argv):
+        time_limit = float(sys.argv[sys.argv.index("--time-limit") + 1])
+    
     while True:
         display_menu()
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-7): ").strip()
         
         if choice == '1':
             print("\n>>> Running BUBBLE SORT...")
             sorted_data, time_taken = bubble_sort_descending(data.copy())
-            display_sorted_results(sorted_data, time_taken, "BUBBLE SORT")
+            display_sorted_results(sorted_data, time_taken, "BUBBLE SORT", output_file, summary_only)
             
         elif choice == '2':
             print("\n>>> Running INSERTION SORT...")
             sorted_data, time_taken = insertion_sort_descending(data.copy())
-            display_sorted_results(sorted_data, time_taken, "INSERTION SORT")
+            display_sorted_results(sorted_data, time_taken, "INSERTION SORT", output_file, summary_only)
             
         elif choice == '3':
             print("\n>>> Running MERGE SORT...")
             sorted_data, time_taken = merge_sort_descending(data.copy())
-            display_sorted_results(sorted_data, time_taken, "MERGE SORT")
+            display_sorted_results(sorted_data, time_taken, "MERGE SORT", output_file, summary_only)
             
         elif choice == '4':
-            compare_all_sorts(data)
+            print("\n>>> Running INTROSORT...")
+            sorted_data, time_taken = introsort_descending(data.copy())
+            display_sorted_results(sorted_data, time_taken, "INTROSORT", output_file, summary_only)
             
         elif choice == '5':
+            compare_all_sorts(data, time_limit)
+            
+        elif choice == '6':
+            count_all_operations(data)
+            
+        elif choice == '7':
             print("\n<=========================================>")
             print("   Goodbye! Thanks for stopping by :)    ")
             print("<==========================================>\n")
             break
             
         else:
-            print("\n⚠ Invalid choice! Please enter a number between 1 and 5.")
\ No newline at end of file
+            print("\n⚠ Invalid choice! Please enter a number between 1 and 7.")
\ No newline at end of file